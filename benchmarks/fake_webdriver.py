@@ -0,0 +1,196 @@
+"""
+Scripted W3C WebDriver endpoint for measurements that need no browser.
+
+Every locator declared in src/locators/locators.py resolves to an element,
+so page objects run unchanged against it:
+
+    with FakeWebDriverServer() as server:
+        driver = webdriver.Remote(server.url, options=webdriver.ChromeOptions())
+"""
+import json
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Tuple
+
+from core_driver.async_driver import ELEMENT_KEY, _to_w3c_locator
+from src.locators import locators
+
+# 1x1 transparent PNG returned for screenshots
+_PNG = (
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAC0lEQVR4nGNgAAIAAAUAAXpeqz8AAAAASUVORK5CYII="
+)
+
+_TEXT_PREDICATE = re.compile(r"text\(\)='([^']*)'")
+
+
+def _locator_elements() -> Dict[Tuple[str, str], str]:
+    """Map every locator of the locators module to the text it points at."""
+    elements = {}
+    for group in vars(locators).values():
+        if not isinstance(group, type) or group.__module__ != locators.__name__:
+            continue
+        for name, value in vars(group).items():
+            if name.isupper() and isinstance(value, tuple):
+                match = _TEXT_PREDICATE.search(value[1])
+                elements[_to_w3c_locator(*value)] = match.group(1) if match else ""
+    return elements
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes, Nagle would delay every reply
+    disable_nagle_algorithm = True
+    server: "FakeWebDriverServer"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, value=None, status=200):
+        body = json.dumps({"value": value}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _error(self, error, status=404):
+        self._reply({"error": error, "message": error, "stacktrace": ""}, status)
+
+    def _payload(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(length) or b"{}")
+
+    def do_GET(self):  # noqa: N802
+        self._dispatch("GET", {})
+
+    def do_POST(self):  # noqa: N802
+        self._dispatch("POST", self._payload())
+
+    def do_DELETE(self):  # noqa: N802
+        self._dispatch("DELETE", {})
+
+    def _dispatch(self, method, payload):
+        parts = self.path.strip("/").split("/")
+        if parts == ["status"]:
+            return self._reply({"ready": True, "message": "fake"})
+        if parts == ["session"] and method == "POST":
+            return self._reply(self.server.new_session())
+        if len(parts) < 2 or parts[1] not in self.server.sessions:
+            return self._error("invalid session id")
+
+        session_id, command = parts[1], "/".join(parts[2:])
+        if command.startswith("element/"):
+            return self._element(parts[3], "/".join(parts[4:]))
+        handler = self._COMMANDS.get(command.split("/")[0], _Handler._default)
+        return handler(self, method, session_id, command, payload)
+
+    def _default(self, method, session_id, command, payload):
+        return self._reply()
+
+    def _session(self, method, session_id, command, payload):
+        if method == "DELETE":
+            del self.server.sessions[session_id]
+        return self._reply()
+
+    def _url(self, method, session_id, command, payload):
+        session = self.server.sessions[session_id]
+        if method == "POST":
+            session["url"] = payload["url"]
+            return self._reply()
+        return self._reply(session["url"])
+
+    def _title(self, method, session_id, command, payload):
+        return self._reply(self.server.title)
+
+    def _find(self, method, session_id, command, payload):
+        locator = (payload["using"], payload["value"])
+        element_id = self.server.element_ids.get(locator)
+        if command == "elements":
+            return self._reply([{ELEMENT_KEY: element_id}] if element_id else [])
+        if element_id is None:
+            return self._error("no such element")
+        return self._reply({ELEMENT_KEY: element_id})
+
+    def _execute(self, method, session_id, command, payload):
+        # readyState polling and the isDisplayed atom are the only scripts
+        if "readyState" in payload.get("script", ""):
+            return self._reply("complete")
+        return self._reply(True)
+
+    def _screenshot(self, method, session_id, command, payload):
+        return self._reply(_PNG)
+
+    def _window(self, method, session_id, command, payload):
+        return self._reply({"x": 0, "y": 0, "width": 1920, "height": 1080})
+
+    _COMMANDS = {
+        "": _session,
+        "url": _url,
+        "title": _title,
+        "element": _find,
+        "elements": _find,
+        "execute": _execute,
+        "screenshot": _screenshot,
+        "window": _window,
+    }
+
+    def _element(self, element_id, command):
+        if element_id not in self.server.texts:
+            return self._error("stale element reference")
+        if command == "text":
+            return self._reply(self.server.texts[element_id])
+        if command in ("displayed", "enabled"):
+            return self._reply(True)
+        if command == "name":
+            return self._reply("div")
+        return self._reply()
+
+
+class FakeWebDriverServer(ThreadingHTTPServer):
+    """
+    In-process WebDriver server with scripted, zero-latency responses.
+
+    :param elements (Optional[dict]): (using, value) locator to element text,
+    defaults to every locator of the locators module.
+    :param title (str): Title returned for every page.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, elements: Optional[Dict[Tuple[str, str], str]] = None, title="Fake"
+    ):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.title = title
+        self.sessions: Dict[str, dict] = {}
+        self.element_ids: Dict[Tuple[str, str], str] = {}
+        self.texts: Dict[str, str] = {}
+        for locator, text in (elements or _locator_elements()).items():
+            element_id = uuid.uuid4().hex
+            self.element_ids[locator] = element_id
+            self.texts[element_id] = text
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def new_session(self) -> dict:
+        session_id = uuid.uuid4().hex
+        self.sessions[session_id] = {"url": "about:blank"}
+        return {
+            "sessionId": session_id,
+            "capabilities": {"browserName": "chrome", "browserVersion": "fake"},
+        }
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
@@ -0,0 +1,67 @@
+"""
+Cold versus templated browser start benchmark.
+
+Usage:
+    python -m benchmarks.profile_template --env dev --type local --runs 5
+"""
+import argparse
+import statistics
+import time
+
+from dotenv import load_dotenv
+
+from core_driver.driver import _wait_for_page_load
+from core_driver.driver_factory import WebDriverFactory
+from core_driver.profile_template import ProfileTemplate
+
+
+def _measure(environment, driver_type, use_profile_template):
+    start = time.perf_counter()
+    driver = WebDriverFactory.create_driver(
+        environment=environment,
+        driver_type=driver_type,
+        use_profile_template=use_profile_template,
+    )
+    try:
+        _wait_for_page_load(driver)
+        return time.perf_counter() - start
+    finally:
+        driver.quit()
+        ProfileTemplate.release(getattr(driver, "profile_dir", None))
+
+
+def run(environment, driver_type, runs):
+    # Build the template up front so the first templated run is not a cold one
+    _measure(environment, driver_type, use_profile_template=True)
+
+    results = {}
+    for label, templated in (("cold", False), ("templated", True)):
+        samples = [
+            _measure(environment, driver_type, templated) for _ in range(runs)
+        ]
+        results[label] = samples
+        print(
+            f"{label:>10}: median {statistics.median(samples):.3f}s "
+            f"min {min(samples):.3f}s max {max(samples):.3f}s"
+        )
+
+    speedup = statistics.median(results["cold"]) / statistics.median(
+        results["templated"]
+    )
+    print(f"{'speedup':>10}: {speedup:.2f}x")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--env", default="dev", help="Environment to open")
+    parser.add_argument("--type", default="local", help="Driver type")
+    parser.add_argument("--runs", type=int, default=5, help="Samples per mode")
+    args = parser.parse_args()
+
+    load_dotenv()
+    run(args.env, args.type, args.runs)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+"""
+Framework overhead benchmarks that run entirely on this machine.
+
+Usage:
+    python -m benchmarks.run --save            # record benchmarks/baseline.json
+    python -m benchmarks.run                   # compare against the baseline
+    python -m benchmarks.run --browser         # also measure a real Chrome
+
+Every metric is the best time of one operation in seconds over several
+repeats, so scheduler noise only ever adds time and the minimum is the
+stable figure. The run fails when a metric is slower than the baseline by
+more than --threshold and, for metrics made of file reads or socket round
+trips, by more than their noise floor.
+"""
+import argparse
+import contextlib
+import functools
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+import timeit
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict
+
+from selenium import webdriver
+
+from benchmarks import visual
+from benchmarks.fake_webdriver import FakeWebDriverServer
+from core_driver.driver import LocalDriver
+from core_driver.driver_options import _init_driver_options
+from src.locators.locators import General, TextBoxFields
+from src.pageobjects.base_page import BasePage
+from utils.helpers import timing
+from utils.logger import log
+from utils.yaml_reader import YAMLReader
+
+BENCH_DIR = Path(__file__).resolve().parent
+SITE_DIR = BENCH_DIR / "site"
+DEFAULT_BASELINE = BENCH_DIR / "baseline.json"
+
+# Absolute slowdown in seconds that metrics of a prefix may show as jitter.
+# File reads and loopback round trips of about a millisecond vary by more
+# than any ratio on a shared machine.
+NOISE_FLOOR = {"yaml.": 0.5e-3, "fake.": 0.5e-3, "browser.": 20e-3}
+
+
+def _per_call(func: Callable, number: int, repeat: int = 10) -> float:
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        samples = timeit.repeat(func, number=number, repeat=repeat)
+    return min(samples) / number
+
+
+def _noise_floor(name: str) -> float:
+    for prefix, floor in NOISE_FLOOR.items():
+        if name.startswith(prefix):
+            return floor
+    return 0.0
+
+
+class _Target:
+    def plain(self, value):
+        return value
+
+    @log()
+    def logged(self, value):
+        return value
+
+    @timing
+    def timed(self, value):
+        return value
+
+
+def bench_decorators() -> Dict[str, float]:
+    # Absolute per-call times, a difference of two medians is mostly noise
+    target = _Target()
+    return {
+        "decorator.plain_call": _per_call(lambda: target.plain(1), 20000),
+        "decorator.log_call": _per_call(lambda: target.logged(1), 20000),
+        "decorator.timing_call": _per_call(lambda: target.timed(1), 20000),
+    }
+
+
+def bench_yaml() -> Dict[str, float]:
+    return {
+        "yaml.read": _per_call(lambda: YAMLReader.read("data.yaml"), 200),
+        "yaml.read_namespace": _per_call(
+            lambda: YAMLReader.read("data.yaml", to_simple_namespace=True), 200
+        ),
+        "yaml.read_caps": _per_call(
+            lambda: YAMLReader.read_caps("chrome", "caps.yaml"), 200
+        ),
+    }
+
+
+def bench_page(
+    driver, prefix: str, number: int, repeat: int = 5
+) -> Dict[str, float]:
+    page = BasePage(driver)
+    return {
+        f"{prefix}.wait_for": _per_call(
+            lambda: page.wait_for(General.ELEMENTS), number, repeat
+        ),
+        f"{prefix}.click": _per_call(
+            lambda: page.click(TextBoxFields.TEXT_BOX), number, repeat
+        ),
+        f"{prefix}.set": _per_call(
+            lambda: page.set(TextBoxFields.USER_NAME, "benchmark"), number, repeat
+        ),
+        f"{prefix}.get_text": _per_call(
+            lambda: page.get_text(General.ELEMENTS), number, repeat
+        ),
+    }
+
+
+class _FakeDriver(LocalDriver):
+    """LocalDriver whose browser is the fake endpoint instead of chromedriver."""
+
+    def __init__(self, url: str):
+        self.url = url
+
+    def _start(self, options, dr_type):
+        return webdriver.Remote(command_executor=self.url, options=options)
+
+
+@contextlib.contextmanager
+def _base_url(url: str):
+    previous = os.environ.get("DEV_URL")
+    os.environ["DEV_URL"] = url
+    try:
+        yield "dev"
+    finally:
+        if previous is None:
+            del os.environ["DEV_URL"]
+        else:
+            os.environ["DEV_URL"] = previous
+
+
+def bench_fake_driver() -> Dict[str, float]:
+    with FakeWebDriverServer() as server, _base_url(server.url) as environment:
+        fake = _FakeDriver(server.url)
+
+        def create_driver():
+            # Options, session start and _configure_driver, as in make_driver
+            fake.create_driver(environment=environment, dr_type="local").quit()
+
+        results = {
+            "fake.driver_creation": _per_call(create_driver, 1, repeat=100)
+        }
+        driver = fake.create_driver(environment=environment, dr_type="local")
+        try:
+            # Single calls: round trips range from 2 to 7 ms, a batch of them
+            # averages in the slow ones while the best single call is stable
+            results.update(bench_page(driver, "fake.page", 1, repeat=200))
+        finally:
+            driver.quit()
+    return results
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+@contextlib.contextmanager
+def serve_site():
+    """Serve the bundled fixture site on a random local port."""
+    handler = functools.partial(_QuietHandler, directory=str(SITE_DIR))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/index.html"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def bench_browser() -> Dict[str, float]:
+    local = LocalDriver()
+
+    def create_driver():
+        local._start(_init_driver_options(dr_type="local"), "local").quit()
+
+    results = {"browser.driver_creation": _per_call(create_driver, 1, repeat=3)}
+    with serve_site() as url:
+        driver = local._start(_init_driver_options(dr_type="local"), "local")
+        try:
+            driver.get(url)
+            results.update(bench_page(driver, "browser.page", 20))
+        finally:
+            driver.quit()
+    return results
+
+
+def compare(results, baseline, threshold) -> list:
+    regressions = []
+    for name, base in baseline["metrics"].items():
+        current = results.get(name)
+        if current is None or base <= 0:
+            continue
+        ratio = current / base
+        slower = current - base > _noise_floor(name)
+        status = "REGRESSION" if ratio > 1 + threshold and slower else "ok"
+        print(
+            f"{name:<32} {base * 1e6:>12.2f}us {current * 1e6:>12.2f}us "
+            f"{ratio:>6.2f}x {status}"
+        )
+        if status != "ok":
+            regressions.append(name)
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Framework overhead benchmarks")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="Write the baseline")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="Allowed slowdown ratio before a metric counts as regressed",
+    )
+    parser.add_argument(
+        "--browser", action="store_true", help="Include real Chrome measurements"
+    )
+    args = parser.parse_args()
+
+    # Measure the framework, not console I/O of the shared "selenium" logger
+    logging.getLogger("selenium").setLevel(logging.WARNING)
+
+    results = {}
+    results.update(bench_decorators())
+    results.update(bench_yaml())
+    results.update(bench_fake_driver())
+    results.update(visual.run(width=2560, height=4000, runs=3))
+    if args.browser:
+        results.update(bench_browser())
+
+    if args.save or not args.baseline.exists():
+        args.baseline.write_text(
+            json.dumps(
+                {
+                    "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    "python": platform.python_version(),
+                    "machine": platform.machine(),
+                    "metrics": results,
+                },
+                indent=2,
+            )
+        )
+        for name, value in sorted(results.items()):
+            print(f"{name:<32} {value * 1e6:>12.2f}us")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = compare(results, baseline, args.threshold)
+    if regressions:
+        print(f"Regressed past {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Visual checkpoint comparison benchmark on large synthetic screenshots.
+
+Usage:
+    python -m benchmarks.visual --width 2560 --height 10000 --runs 5
+"""
+import argparse
+import statistics
+import time
+from typing import Dict
+
+import numpy as np
+
+from utils.visual import VisualComparator
+
+
+def make_screenshot(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """Page-like image: light background, text-like rules and coloured cards."""
+    rng = np.random.default_rng(seed)
+    pixels = np.full((height, width, 3), 245, dtype=np.uint8)
+    pixels[::24, : width * 3 // 4] = 60
+    for top in range(0, height - 160, 240):
+        left = int(rng.integers(0, width // 4))
+        pixels[top:top + 160, left:left + width // 2] = rng.integers(0, 255, 3)
+    return pixels
+
+
+def scenarios(width: int, height: int) -> Dict[str, tuple]:
+    baseline = make_screenshot(width, height)
+
+    widget = baseline.copy()
+    widget[height // 2:height // 2 + 40, 200:520] = (220, 30, 30)
+
+    noise = baseline.copy()
+    noise[::97, ::89] += 2
+
+    dynamic_region = (0, 0, width, 120)
+    dynamic = baseline.copy()
+    dynamic[:120] = 0
+    return {
+        "identical": (baseline, baseline.copy(), ()),
+        "changed_widget": (baseline, widget, ()),
+        "antialias_noise": (baseline, noise, ()),
+        "masked_dynamic": (baseline, dynamic, (dynamic_region,)),
+    }
+
+
+def naive_diff(baseline: np.ndarray, actual: np.ndarray) -> float:
+    delta = np.abs(baseline.astype(np.int16) - actual.astype(np.int16)).max(axis=-1)
+    return float((delta > 16).mean())
+
+
+def run(width: int, height: int, runs: int) -> Dict[str, float]:
+    comparator = VisualComparator()
+    results = {}
+    for name, (baseline, actual, masks) in scenarios(width, height).items():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            comparator.compare(baseline, actual, masks)
+            samples.append(time.perf_counter() - start)
+        results[f"visual.{name}"] = statistics.median(samples)
+
+    baseline, actual, _ = scenarios(width, height)["changed_widget"]
+    start = time.perf_counter()
+    naive_diff(baseline, actual)
+    results["visual.naive_full_diff"] = time.perf_counter() - start
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--width", type=int, default=2560)
+    parser.add_argument("--height", type=int, default=10000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.width}x{args.height} screenshot")
+    for name, value in run(args.width, args.height, args.runs).items():
+        print(f"{name:<28} {value * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
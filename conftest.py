@@ -1,12 +1,25 @@
+import asyncio
 import pytest
 import os
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
+from properties import Properties
 from selenium.webdriver.support.event_firing_webdriver import EventFiringWebDriver
 
+from core_driver.async_driver import AsyncDriverService
 from core_driver.event_listener import EventListener
 from core_driver.driver_factory import WebDriverFactory
+from core_driver.governor import MemoryGovernor
+from core_driver.health import SessionHealth
+from core_driver.http_driver import HttpDriver
+from core_driver.profile_template import ProfileTemplate
+from core_driver.tab_pool import TabPool
+from utils.data_driven import load_row, parametrize_data_driven
 from utils.logger import Logger, LogLevel
+from utils.report_renderer import render as render_stream_report
+from utils.retry import metrics as retry_metrics, time_budget
+from utils.stream_report import StreamingReporter, clear_run
 
 log = Logger(log_lvl=LogLevel.INFO).get_instance()
 
@@ -25,29 +38,147 @@ def driver_types(request):
 
 
 @pytest.fixture
-def make_driver(request) -> EventFiringWebDriver:
+def data_row(request):
+    """Row of a @data_driven source, read only when the test runs."""
+    return load_row(request.param)
+
+
+def pytest_generate_tests(metafunc):
+    parametrize_data_driven(metafunc)
+
+
+@pytest.fixture(autouse=True)
+def retry_budget(request):
+    """Cap the time retries may spend in one test and record their counts."""
+    before = retry_metrics.snapshot()
+    with time_budget(request.config.getoption("--retry-budget")):
+        yield
+    retries = retry_metrics.since(before)
+    if retries:
+        request.node.user_properties.append(("retries", retries))
+
+
+@pytest.fixture(scope="session")
+def governor(request) -> MemoryGovernor:
+    """Hands out browser permits shared by all xdist workers on this host."""
+    return MemoryGovernor(
+        max_sessions=request.config.getoption("--max-browsers"),
+        min_available_mb=request.config.getoption("--min-free-memory-mb"),
+        max_session_rss_mb=request.config.getoption("--max-browser-rss-mb"),
+    )
+
+
+def _create_driver(request) -> EventFiringWebDriver:
+    # Create WebDriver instance and attach the event listener
+    driver = WebDriverFactory().create_driver(
+        environment=request.config.getoption("--env"),
+        driver_type=request.config.getoption("--type"),
+        use_profile_template=request.config.getoption("--profile-template"),
+    )
+    return event_listener(driver)
+
+
+@pytest.fixture(scope="session")
+def tab_pool(request, governor) -> TabPool:
+    """Browser of this worker shared through tabs, used with --shared-browser."""
+    load_dotenv(dotenv_path=f"{request.config.getoption('--env')}")
+    permit = None
+
+    def _create_shared_driver() -> EventFiringWebDriver:
+        nonlocal permit
+        # One permit covers the shared browser for the whole worker
+        if permit is None:
+            permit = governor.acquire()
+        return _create_driver(request)
+
+    pool = TabPool(_create_shared_driver, governor)
+    yield pool
+    try:
+        pool.quit()
+    finally:
+        if permit is not None:
+            permit.release()
+
+
+@pytest.fixture
+def make_driver(request, governor) -> EventFiringWebDriver:
     load_dotenv(dotenv_path=f"{request.config.getoption('--env')}")
     env = request.config.getoption("--env")
-    dr_type = request.config.getoption("--type")
-    driver = None
-
-    def _make_driver() -> EventFiringWebDriver:
-        nonlocal driver
-        # Create WebDriver instance
-        driver = WebDriverFactory().create_driver(
-            environment=env, driver_type=dr_type
+
+    if request.node.get_closest_marker("http_only"):
+        # Read-only checks need no browser and no browser permit
+        http_driver = HttpDriver()
+        http_driver.get(Properties.get_base_url(env))
+        yield http_driver
+        http_driver.quit()
+        return
+
+    if request.config.getoption("--shared-browser"):
+        # A tab with its own storage context instead of a whole browser
+        tab_driver = request.getfixturevalue("tab_pool").open(
+            Properties.get_base_url(env)
         )
-        # Attach event listener
-        driver_with_listener = event_listener(driver)
-        return driver_with_listener
+        yield tab_driver
+        tab_driver.quit()
+        return
 
-    driver_instance = _make_driver()
+    permit = governor.acquire()
+    try:
+        driver_instance = _create_driver(request)
+    except Exception:
+        permit.release()
+        raise
+    # Stops the driver as soon as the browser dies, so calls fail fast
+    health = SessionHealth(driver_instance).start()
 
     yield driver_instance
 
-    # Teardown code to quit the driver
-    if driver is not None:
-        driver.quit()
+    # Teardown code to quit the driver, a dead session is killed instead
+    profile_dir = getattr(driver_instance.wrapped_driver, "profile_dir", None)
+    try:
+        try:
+            health.close(driver_instance)
+        finally:
+            # The cloned profile goes even if the browser could not be stopped
+            ProfileTemplate.release(profile_dir)
+    finally:
+        # A leaked permit would block every worker until the timeout
+        permit.release()
+
+
+@pytest.fixture(scope="session")
+def async_driver_service(request) -> AsyncDriverService:
+    # One chromedriver per worker serves every concurrent async session
+    service = AsyncDriverService(dr_type=request.config.getoption("--type"))
+    service.start()
+    yield service
+    service.stop()
+
+
+@pytest.fixture
+def make_async_driver(request, async_driver_service, governor):
+    """
+    Factory of async sessions. Use it inside a coroutine run by the test:
+
+        async with make_async_driver() as driver:
+            page = AsyncBasePage(driver)
+
+    Every session holds a governor permit like a make_driver browser does.
+    """
+    load_dotenv(dotenv_path=f"{request.config.getoption('--env')}")
+    env = request.config.getoption("--env")
+
+    @asynccontextmanager
+    async def _make_async_driver():
+        # acquire() blocks while waiting, keep it off the event loop
+        permit = await asyncio.to_thread(governor.acquire)
+        try:
+            async with async_driver_service.session(environment=env) as driver:
+                yield driver
+        finally:
+            permit.release()
+
+    return _make_async_driver
 
 
 def pytest_addoption(parser):
@@ -63,6 +194,84 @@ def pytest_addoption(parser):
     parser.addoption(
         "--type", action="store", default="local", help="Run browser in os type"
     )
+    parser.addoption(
+        "--profile-template",
+        action="store_true",
+        default=False,
+        help="Start browsers from a warmed, cloned profile template",
+    )
+    parser.addoption(
+        "--shared-browser",
+        action="store_true",
+        default=False,
+        help="Run each test in its own tab of one browser per worker",
+    )
+    parser.addoption(
+        "--max-browsers",
+        action="store",
+        type=int,
+        default=None,
+        help="Browsers allowed at once on this host across workers (CPU count)",
+    )
+    parser.addoption(
+        "--min-free-memory-mb",
+        action="store",
+        type=int,
+        default=512,
+        help="Pause browser creation while available memory is below this",
+    )
+    parser.addoption(
+        "--max-browser-rss-mb",
+        action="store",
+        type=int,
+        default=2048,
+        help="Recycle a long-lived session once its process tree grows past this",
+    )
+    parser.addoption(
+        "--update-baselines",
+        action="store_true",
+        default=False,
+        help="Replace visual checkpoint baselines with the new screenshots",
+    )
+    parser.addoption(
+        "--stream-report",
+        action="store",
+        default=None,
+        help="Directory for per-worker JSONL results, rendered to <dir>/html",
+    )
+    parser.addoption(
+        "--retry-budget",
+        action="store",
+        type=float,
+        default=60.0,
+        help="Seconds all retries of one test may spend, 0 disables the cap",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    if config.getoption("--update-baselines"):
+        # Read by utils.visual.check_visual, also in xdist workers
+        os.environ["UPDATE_BASELINES"] = "1"
+    stream_dir = config.getoption("--stream-report")
+    if stream_dir:
+        # Runs before pytest-html configures itself: the streamed report
+        # replaces the self-contained one from addopts, which holds every
+        # result in memory and inlines it at session end
+        if getattr(config.option, "htmlpath", None):
+            config.option.htmlpath = None
+        if not hasattr(config, "workerinput"):
+            # xdist starts the workers after this, none has written yet
+            clear_run(stream_dir, os.path.join(stream_dir, "html"))
+        config.pluginmanager.register(
+            StreamingReporter(stream_dir), "stream_report"
+        )
+
+
+def pytest_sessionfinish(session):
+    stream_dir = session.config.getoption("--stream-report")
+    if stream_dir and not hasattr(session.config, "workerinput"):
+        render_stream_report(stream_dir, os.path.join(stream_dir, "html"))
 
 
 def pytest_runtest_makereport(item, call):
@@ -81,7 +290,24 @@ def pytest_runtest_makereport(item, call):
             try:
                 driver.save_screenshot(screenshot_path)
                 log.info(f"Screenshot saved to: {screenshot_path}")
+                # Linked, not embedded, by the streaming report
+                item.user_properties.append(("screenshot", screenshot_path))
             except Exception as e:
                 log.error(f"Failed to save screenshot: {e}")
         else:
             log.error("Driver instance is not available for capturing screenshot.")
+
+
+def pytest_terminal_summary(terminalreporter):
+    """Report retry counts collected from every test, including xdist workers."""
+    totals = {}
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            for name, value in getattr(report, "user_properties", ()):
+                if name == "retries" and report.when == "teardown":
+                    for key, count in value.items():
+                        totals[key] = totals.get(key, 0) + count
+    if totals:
+        terminalreporter.write_sep("-", "retries")
+        for key, count in sorted(totals.items()):
+            terminalreporter.write_line(f"{key}: {count}")
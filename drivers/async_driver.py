@@ -0,0 +1,338 @@
+import asyncio
+import json
+import socket
+import subprocess
+import time
+import urllib.request
+from contextlib import asynccontextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    JavascriptException,
+    NoSuchElementException,
+    NoSuchWindowException,
+    SessionNotCreatedException,
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from webdriver_manager.chrome import ChromeDriverManager
+
+from core_driver.driver import _get_driver_path
+from core_driver.driver_options import _init_driver_options
+from properties import Properties
+from utils.error_handler import ErrorHandler, ErrorType
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+# Web element identifier of the W3C WebDriver spec
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+_W3C_ERRORS = {
+    "no such element": NoSuchElementException,
+    "stale element reference": StaleElementReferenceException,
+    "element click intercepted": ElementClickInterceptedException,
+    "element not interactable": ElementNotInteractableException,
+    "invalid selector": InvalidSelectorException,
+    "javascript error": JavascriptException,
+    "no such window": NoSuchWindowException,
+    "session not created": SessionNotCreatedException,
+    "timeout": TimeoutException,
+}
+
+
+def _to_w3c_locator(by: str, value: str) -> Tuple[str, str]:
+    """Translate Selenium locator strategies into the ones W3C supports."""
+    if by == By.ID:
+        return By.CSS_SELECTOR, f'[id="{value}"]'
+    if by == By.NAME:
+        return By.CSS_SELECTOR, f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return By.CSS_SELECTOR, f".{value}"
+    return by, value
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class AsyncW3CConnection:
+    """
+    Minimal keep-alive HTTP/1.1 client for the W3C WebDriver wire protocol.
+
+    :param host (str): Driver server host.
+    :param port (int): Driver server port.
+    :param max_connections (int): Upper bound of open sockets to the server.
+    """
+
+    def __init__(self, host: str, port: int, max_connections: int = 4):
+        self.host = host
+        self.port = port
+        self._idle: List[Tuple[asyncio.StreamReader, asyncio.StreamWriter]] = []
+        self._slots = asyncio.Semaphore(max_connections)
+
+    async def _acquire(self):
+        if self._idle:
+            return self._idle.pop()
+        return await asyncio.open_connection(self.host, self.port)
+
+    async def request(
+        self, method: str, path: str, payload: Optional[Dict[str, Any]] = None
+    ) -> Any:
+        body = json.dumps(payload).encode() if payload is not None else b""
+        head = (
+            f"{method} {path} HTTP/1.1\r\n"
+            f"Host: {self.host}:{self.port}\r\n"
+            "Content-Type: application/json;charset=UTF-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: keep-alive\r\n\r\n"
+        ).encode()
+
+        async with self._slots:
+            reader, writer = await self._acquire()
+            try:
+                writer.write(head + body)
+                await writer.drain()
+                status, keep_alive, data = await self._read_response(reader)
+            except BaseException:
+                writer.close()
+                raise
+            if keep_alive:
+                self._idle.append((reader, writer))
+            else:
+                writer.close()
+
+        value = json.loads(data or b"{}").get("value")
+        if status >= 400:
+            error = value.get("error", "") if isinstance(value, dict) else ""
+            message = value.get("message", "") if isinstance(value, dict) else value
+            raise _W3C_ERRORS.get(error, WebDriverException)(message)
+        return value
+
+    @staticmethod
+    async def _read_response(reader: asyncio.StreamReader):
+        status_line = await reader.readline()
+        if not status_line:
+            raise WebDriverException("Driver server closed the connection")
+        status = int(status_line.split()[1])
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            data = b"".join(chunks)
+        else:
+            data = await reader.readexactly(int(headers.get("content-length", 0)))
+
+        keep_alive = headers.get("connection", "").lower() != "close"
+        return status, keep_alive, data
+
+    async def close(self) -> None:
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+
+class AsyncWebElement:
+    def __init__(self, driver: "AsyncWebDriver", element_id: str):
+        self._driver = driver
+        self.id = element_id
+
+    async def _execute(self, method: str, command: str, payload=None):
+        return await self._driver.execute(
+            method, f"/element/{self.id}/{command}", payload
+        )
+
+    async def click(self) -> None:
+        await self._execute("POST", "click", {})
+
+    async def clear(self) -> None:
+        await self._execute("POST", "clear", {})
+
+    async def send_keys(self, text: str) -> None:
+        await self._execute("POST", "value", {"text": str(text)})
+
+    async def text(self) -> str:
+        return await self._execute("GET", "text")
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return await self._execute("GET", f"attribute/{name}")
+
+    async def is_displayed(self) -> bool:
+        return await self._execute("GET", "displayed")
+
+    async def is_enabled(self) -> bool:
+        return await self._execute("GET", "enabled")
+
+
+class AsyncWebDriver:
+    """
+    Awaitable WebDriver session talking W3C over a pooled HTTP connection.
+    Many sessions can share one event loop, so a single worker process can
+    drive several browsers concurrently.
+    """
+
+    def __init__(self, connection: AsyncW3CConnection, session_id: str):
+        self._connection = connection
+        self.session_id = session_id
+
+    @classmethod
+    async def create(
+        cls, connection: AsyncW3CConnection, capabilities: Dict[str, Any]
+    ) -> "AsyncWebDriver":
+        try:
+            value = await connection.request(
+                "POST", "/session", {"capabilities": {"alwaysMatch": capabilities}}
+            )
+        except BaseException:
+            # The socket is back in the idle pool, nobody would close it
+            await connection.close()
+            raise
+        driver = cls(connection, value["sessionId"])
+        log.info(f"Async driver created with session: {driver.session_id}")
+        return driver
+
+    async def execute(self, method: str, command: str = "", payload=None) -> Any:
+        return await self._connection.request(
+            method, f"/session/{self.session_id}{command}", payload
+        )
+
+    async def get(self, url: str) -> None:
+        await self.execute("POST", "/url", {"url": url})
+
+    async def title(self) -> str:
+        return await self.execute("GET", "/title")
+
+    async def current_url(self) -> str:
+        return await self.execute("GET", "/url")
+
+    async def refresh(self) -> None:
+        await self.execute("POST", "/refresh", {})
+
+    async def execute_script(self, script: str, *args) -> Any:
+        return await self.execute(
+            "POST", "/execute/sync", {"script": script, "args": list(args)}
+        )
+
+    async def find_element(self, by: str, value: str) -> AsyncWebElement:
+        using, value = _to_w3c_locator(by, value)
+        result = await self.execute(
+            "POST", "/element", {"using": using, "value": value}
+        )
+        return AsyncWebElement(self, result[ELEMENT_KEY])
+
+    async def find_elements(self, by: str, value: str) -> List[AsyncWebElement]:
+        using, value = _to_w3c_locator(by, value)
+        result = await self.execute(
+            "POST", "/elements", {"using": using, "value": value}
+        )
+        return [AsyncWebElement(self, item[ELEMENT_KEY]) for item in result]
+
+    async def quit(self) -> None:
+        try:
+            await self.execute("DELETE")
+        finally:
+            await self._connection.close()
+
+
+class AsyncDriverService:
+    """
+    Runs one chromedriver process that serves every async session of a worker.
+
+    Only Chrome ('local') is supported, other driver types are rejected
+    instead of sending their browser options to chromedriver.
+
+    :param dr_type (str): Driver type used to build browser options.
+    :param executable_path (Optional[str]): chromedriver binary to launch.
+    """
+
+    def __init__(
+        self, dr_type: str = "local", executable_path: Optional[str] = None
+    ):
+        if dr_type != "local":
+            ErrorHandler.raise_error(
+                ErrorType.UNSUPPORTED_DRIVER_TYPE,
+                dr_type,
+                custom_message="(async sessions run on chromedriver, use local)",
+            )
+        self.dr_type = dr_type
+        self.executable_path = executable_path
+        self.host = "127.0.0.1"
+        self.port = None
+        self.process = None
+
+    def start(self, timeout: int = 20) -> "AsyncDriverService":
+        if self.executable_path is None:
+            try:
+                self.executable_path = ChromeDriverManager().install()
+            except Exception as e:
+                log.error(f"ChromeDriverManager failed, using local driver: {e}")
+                self.executable_path = _get_driver_path("chromedriver")
+
+        self.port = _free_port()
+        self.process = subprocess.Popen(
+            [self.executable_path, f"--port={self.port}"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with urllib.request.urlopen(f"{self.url}/status", timeout=1) as resp:
+                    if json.load(resp)["value"].get("ready"):
+                        log.info(f"Async driver service started on {self.url}")
+                        return self
+            except OSError:
+                pass
+            time.sleep(0.1)
+        self.stop()
+        raise WebDriverException(f"Driver service did not start on {self.url}")
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def stop(self) -> None:
+        if self.process is not None:
+            self.process.terminate()
+            try:
+                self.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                log.warning(f"Driver service on {self.url} hung, killing it")
+                self.process.kill()
+                self.process.wait()
+            self.process = None
+
+    @asynccontextmanager
+    async def session(self, environment: Optional[str] = None):
+        """Open a browser session, navigate to the base url and quit on exit."""
+        options = _init_driver_options(dr_type=self.dr_type)
+        driver = await AsyncWebDriver.create(
+            AsyncW3CConnection(self.host, self.port), options.to_capabilities()
+        )
+        try:
+            if environment:
+                await driver.get(Properties.get_base_url(environment))
+            yield driver
+        finally:
+            await driver.quit()
@@ -3,8 +3,10 @@ from abc import ABC, abstractmethod
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.support.wait import WebDriverWait
 from webdriver_manager.chrome import ChromeDriverManager
 from core_driver.driver_options import _init_driver_options
+from core_driver.profile_template import ProfileTemplate
 from utils.error_handler import ErrorHandler, ErrorType
 from utils.logger import Logger, LogLevel
 from properties import Properties
@@ -38,11 +40,53 @@ def _configure_driver(driver, environment):
     )
 
 
+def _wait_for_page_load(driver, timeout=30):
+    # page_load_strategy is "none", so wait for the document explicitly
+    WebDriverWait(driver, timeout).until(
+        lambda d: d.execute_script("return document.readyState") == "complete"
+    )
+
+
 class Driver(ABC):
     @abstractmethod
-    def create_driver(self, environment, dr_type):
+    def create_driver(self, environment, dr_type, **kwargs):
         pass
 
+    @abstractmethod
+    def _start(self, options, dr_type):
+        """Launch the browser with the given options."""
+
+    def _get_profile_dir(self, environment, dr_type, use_profile_template):
+        """Clone a warmed profile template for the new session."""
+        if not use_profile_template:
+            return None
+        template = ProfileTemplate(dr_type, environment)
+        template.cleanup_stale()
+        return template.clone(
+            warm=lambda path: self._warm_profile(path, environment, dr_type)
+        )
+
+    def _warm_profile(self, profile_dir, environment, dr_type):
+        """Run the browser once against the app to fill the profile caches."""
+        options = _init_driver_options(dr_type=dr_type, profile_dir=profile_dir)
+        driver = self._start(options, dr_type)
+        try:
+            _configure_driver(driver, environment)
+            _wait_for_page_load(driver)
+        finally:
+            driver.quit()
+
+    def _create(self, environment, dr_type, use_profile_template=False):
+        profile_dir = self._get_profile_dir(
+            environment, dr_type, use_profile_template
+        )
+        options = _init_driver_options(dr_type=dr_type, profile_dir=profile_dir)
+        driver = self._start(options, dr_type)
+        # Session clone is removed by ProfileTemplate.release after quit
+        driver.profile_dir = profile_dir
+        _configure_driver(driver, environment)
+        return driver
+
     def get_desired_caps(self, browser="chrome"):
         try:
             caps = YAMLReader.read_caps(browser)
@@ -54,9 +98,12 @@ class Driver(ABC):
 
 
 class LocalDriver(Driver):
-    def create_driver(self, environment=None, dr_type="chromedriver"):
-        driver = None
-        options = _init_driver_options(dr_type=dr_type)
+    def create_driver(
+        self, environment=None, dr_type="chromedriver", use_profile_template=False
+    ):
+        return self._create(environment, dr_type, use_profile_template)
+
+    def _start(self, options, dr_type):
         try:
             driver_path = ChromeDriverManager().install()
             driver = webdriver.Chrome(
@@ -70,12 +117,14 @@ class LocalDriver(Driver):
                 service=ChromeService(_get_driver_path(dr_type)),
                 options=options
             )
-        _configure_driver(driver, environment)
         return driver
 
 
 class ChromeRemoteDriver(Driver):
-    def create_driver(self, environment=None, dr_type=None):
+    def create_driver(self, environment=None, dr_type=None, **kwargs):
+        return self._start(None, dr_type)
+
+    def _start(self, options, dr_type):
         caps = self.get_desired_caps()
         driver = webdriver.Remote(
             command_executor=RemoteConnection("your remote URL"),
@@ -86,9 +135,12 @@ class ChromeRemoteDriver(Driver):
 
 
 class FirefoxDriver(Driver):
-    def create_driver(self, environment=None, dr_type="firefox"):
-        driver = None
-        options = _init_driver_options(dr_type=dr_type)
+    def create_driver(
+        self, environment=None, dr_type="firefox", use_profile_template=False
+    ):
+        return self._create(environment, dr_type, use_profile_template)
+
+    def _start(self, options, dr_type):
         try:
             driver = webdriver.Firefox(options=options)
             log.info(f"Firefox driver created with session: {driver.session_id}")
@@ -98,5 +150,4 @@ class FirefoxDriver(Driver):
                 service=ChromeService(_get_driver_path("chromedriver")),
                 options=options
             )
-        _configure_driver(driver, environment)
         return driver
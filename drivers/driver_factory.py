@@ -13,13 +13,13 @@ class WebDriverFactory:
     }
 
     @staticmethod
-    def create_driver(environment=None, driver_type="local"):
+    def create_driver(environment=None, driver_type="local", **kwargs):
         log.info(f"Creating driver of type: {driver_type}")
         driver_type = driver_type.lower()
         if driver_type in WebDriverFactory.DRIVER_MAPPING:
             driver_class = WebDriverFactory.DRIVER_MAPPING[driver_type]
             return driver_class().create_driver(
-                environment, driver_type
+                environment, driver_type, **kwargs
             )  # No .value needed
         else:
             raise ErrorHandler.raise_error(
@@ -16,7 +16,17 @@ def _shared_driver_options(options):
     return options
 
 
-def _init_driver_options(dr_type=None):
+def _set_profile_dir(options, dr_type, profile_dir):
+    # Chrome takes the directory as a user-data-dir, Firefox via geckodriver args
+    if dr_type == "firefox":
+        options.add_argument("-profile")
+        options.add_argument(profile_dir)
+    else:
+        options.add_argument(f"--user-data-dir={profile_dir}")
+    return options
+
+
+def _init_driver_options(dr_type=None, profile_dir=None):
     driver_option_mapping = {
         "local": webdriver.ChromeOptions(),
         "firefox": webdriver.FirefoxOptions(),
@@ -28,5 +38,7 @@ def _init_driver_options(dr_type=None):
         raise ErrorHandler.raise_error(ErrorType.UNSUPPORTED_DRIVER_TYPE, dr_type)
 
     _shared_driver_options(options)
+    if profile_dir:
+        _set_profile_dir(options, dr_type, profile_dir)
     log.info(f"Driver options {options.arguments}")
     return options
@@ -0,0 +1,176 @@
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+import psutil
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+_MB = 1024 * 1024
+
+if os.name == "nt":
+    import msvcrt
+
+    def _try_lock(fh) -> bool:
+        try:
+            msvcrt.locking(fh.fileno(), msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(fh) -> None:
+        fh.seek(0)
+        msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _try_lock(fh) -> bool:
+        try:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return True
+        except OSError:
+            return False
+
+    def _unlock(fh) -> None:
+        fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _get_lock_dir() -> Path:
+    # Shared by every xdist worker of the same checkout
+    project_dir = str(Path(__file__).resolve().parent.parent)
+    key = hashlib.sha1(project_dir.encode()).hexdigest()[:12]
+    return Path(tempfile.gettempdir()) / f"selenium-governor-{key}"
+
+
+class Permit:
+    """Right to run one browser session, held as a lock on a slot file."""
+
+    def __init__(self, slot: int, handle):
+        self.slot = slot
+        self._handle = handle
+
+    def release(self) -> None:
+        if self._handle is not None:
+            _unlock(self._handle)
+            self._handle.close()
+            self._handle = None
+
+
+class MemoryGovernor:
+    """
+    Limits how many browsers run at once on this host across xdist workers.
+
+    Permits are slot files locked with flock (msvcrt on Windows), so a
+    crashed worker releases its slot automatically. A permit is only given
+    out while the host has enough available memory.
+
+    :param max_sessions (Optional[int]): Concurrent browsers, CPU count by default.
+    :param min_available_mb (int): Available host memory needed to start a browser.
+    :param max_session_rss_mb (int): RSS of a browser tree that triggers a recycle.
+    :param timeout (int): Seconds to wait for a permit before giving up.
+    """
+
+    POLL_INTERVAL = 1.0
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        min_available_mb: int = 512,
+        max_session_rss_mb: int = 2048,
+        timeout: int = 600,
+        lock_dir: Optional[Path] = None,
+    ):
+        self.max_sessions = max_sessions or os.cpu_count() or 1
+        self.min_available_mb = min_available_mb
+        self.max_session_rss_mb = max_session_rss_mb
+        self.timeout = timeout
+        self.lock_dir = Path(lock_dir) if lock_dir else _get_lock_dir()
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def host_available_mb() -> float:
+        return psutil.virtual_memory().available / _MB
+
+    def under_pressure(self) -> bool:
+        return self.host_available_mb() < self.min_available_mb
+
+    def acquire(self) -> Permit:
+        """Block until a slot is free and the host is not under memory pressure."""
+        deadline = time.monotonic() + self.timeout
+        waiting_logged = False
+        while True:
+            if not self.under_pressure():
+                permit = self._try_acquire()
+                if permit is not None:
+                    return permit
+            if time.monotonic() > deadline:
+                raise TimeoutError(
+                    f"No browser permit after {self.timeout} seconds "
+                    f"({self.max_sessions} sessions, "
+                    f"{self.host_available_mb():.0f} MB available)"
+                )
+            if not waiting_logged:
+                log.warning(
+                    f"Waiting for a browser permit, available memory "
+                    f"{self.host_available_mb():.0f} MB"
+                )
+                waiting_logged = True
+            time.sleep(self.POLL_INTERVAL)
+
+    def _try_acquire(self) -> Optional[Permit]:
+        for slot in range(self.max_sessions):
+            handle = open(self.lock_dir / f"slot-{slot}.lock", "a+")
+            if _try_lock(handle):
+                return Permit(slot, handle)
+            handle.close()
+        return None
+
+    @staticmethod
+    def session_rss_mb(driver) -> float:
+        """RSS of the driver service process and every browser process it spawned."""
+        service = getattr(driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            # Remote sessions have no local process tree
+            return 0.0
+        try:
+            root = psutil.Process(process.pid)
+            tree = [root] + root.children(recursive=True)
+        except psutil.NoSuchProcess:
+            return 0.0
+
+        total = 0
+        for proc in tree:
+            try:
+                total += proc.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return total / _MB
+
+    def should_recycle(self, driver) -> bool:
+        rss = self.session_rss_mb(driver)
+        if rss > self.max_session_rss_mb:
+            log.warning(
+                f"Session {driver.session_id} uses {rss:.0f} MB, "
+                f"limit {self.max_session_rss_mb} MB"
+            )
+            return True
+        return False
+
+    def recycle_if_needed(self, driver, quit_driver: Callable) -> bool:
+        """
+        End a long-lived session that grew past max_session_rss_mb.
+
+        quit_driver receives the session and releases it the way its owner
+        does, the owner starts a new one when it next needs a browser.
+        """
+        if not self.should_recycle(driver):
+            return False
+        quit_driver(driver)
+        return True
@@ -0,0 +1,135 @@
+import json
+import threading
+from typing import List, Optional
+from urllib.error import HTTPError, URLError
+from urllib.request import urlopen
+
+import psutil
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+
+def _executor_url(driver) -> Optional[str]:
+    executor = getattr(driver, "command_executor", None)
+    config = getattr(executor, "_client_config", None)
+    url = getattr(config, "remote_server_addr", None)
+    url = url or getattr(executor, "_url", None)
+    return url.rstrip("/") if url else None
+
+
+class SessionHealth:
+    """
+    Liveness of one WebDriver session and of the processes behind it.
+
+    The driver service and the browser it launched are watched through their
+    PIDs, and the session is probed with a direct request to the driver
+    service that bypasses the long command timeout of the driver's own
+    connection. Remote sessions have neither and always count as alive.
+
+    A watchdog thread kills the driver service as soon as the browser dies,
+    so pending commands fail at once instead of timing out.
+
+    :param driver: WebDriver, EventFiringWebDriver is unwrapped.
+    :param probe_timeout (float): Seconds the liveness probe may take.
+    :param interval (float): Seconds between watchdog checks.
+    """
+
+    def __init__(self, driver, probe_timeout: float = 2.0, interval: float = 1.0):
+        self.driver = getattr(driver, "wrapped_driver", driver)
+        self.probe_timeout = probe_timeout
+        self.interval = interval
+        self.processes = self._session_processes()
+        self._stop = threading.Event()
+        self._watchdog = None
+
+    def _session_processes(self) -> List[psutil.Process]:
+        service = getattr(self.driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            # Remote sessions have no local processes, only the probe applies
+            return []
+        try:
+            root = psutil.Process(process.pid)
+            return [root] + root.children()
+        except psutil.NoSuchProcess:
+            return []
+
+    def processes_alive(self) -> bool:
+        for proc in self.processes:
+            try:
+                if not proc.is_running() or proc.status() == psutil.STATUS_ZOMBIE:
+                    return False
+            except psutil.NoSuchProcess:
+                return False
+        return True
+
+    def probe(self) -> bool:
+        """Cheap session round trip, fails fast on a hung driver or browser."""
+        url = _executor_url(self.driver)
+        if url is None or self.driver.session_id is None:
+            return False
+        try:
+            with urlopen(
+                f"{url}/session/{self.driver.session_id}/window/handles",
+                timeout=self.probe_timeout,
+            ) as response:
+                json.load(response)
+            return True
+        except HTTPError as e:
+            log.warning(f"Session {self.driver.session_id} probe failed: {e.code}")
+        except (URLError, OSError, ValueError) as e:
+            log.warning(f"Session {self.driver.session_id} probe failed: {e}")
+        return False
+
+    def is_alive(self) -> bool:
+        if not self.processes:
+            # Remote grids put auth in front of the session, keep their own timeouts
+            return True
+        return self.processes_alive() and self.probe()
+
+    def kill(self) -> None:
+        """Kill the driver service and the browser without talking to them."""
+        self.stop()
+        for proc in reversed(self.processes):
+            try:
+                for child in proc.children(recursive=True):
+                    child.kill()
+                proc.kill()
+            except psutil.NoSuchProcess:
+                continue
+        log.warning(f"Killed processes of session {self.driver.session_id}")
+
+    def _watch(self) -> None:
+        while not self._stop.wait(self.interval):
+            if not self.processes_alive():
+                log.error(
+                    f"Browser of session {self.driver.session_id} died, "
+                    f"stopping its driver"
+                )
+                self.kill()
+                return
+
+    def start(self) -> "SessionHealth":
+        if self.processes and self._watchdog is None:
+            self._watchdog = threading.Thread(
+                target=self._watch, name="session-watchdog", daemon=True
+            )
+            self._watchdog.start()
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+        watchdog = self._watchdog
+        if watchdog is not None and watchdog is not threading.current_thread():
+            watchdog.join()
+        self._watchdog = None
+
+    def close(self, driver) -> None:
+        """Quit a healthy session, kill a dead one instead of waiting on it."""
+        self.stop()
+        if self.is_alive():
+            driver.quit()
+        else:
+            self.kill()
@@ -0,0 +1,319 @@
+import re
+from typing import Callable, List, Optional
+
+import requests
+from bs4 import BeautifulSoup, Tag
+from requests.adapters import HTTPAdapter
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from utils.error_handler import ErrorHandler, ErrorType
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+_session: Optional[requests.Session] = None
+
+
+def _get_session() -> requests.Session:
+    """One pooled HTTP session per worker, shared by every HttpDriver."""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=32)
+        _session.mount("http://", adapter)
+        _session.mount("https://", adapter)
+    return _session
+
+
+def _browser_required(action: str):
+    ErrorHandler.raise_error(ErrorType.BROWSER_REQUIRED, f"{action}()")
+
+
+# XPath subset used by the locators: //tag[predicate]//tag[...]/tag
+_STEP = re.compile(
+    r"""(//|/)([\w*-]+)((?:\[(?:[^\]'"]|'[^']*'|"[^"]*")*\])*)"""
+)
+_PREDICATE = re.compile(r"""\[((?:[^\]'"]|'[^']*'|"[^"]*")*)\]""")
+# Predicate tokens: string literals stay whole, so quoted words are never
+# mistaken for operators
+_TOKEN = re.compile(r"""\s*('[^']*'|"[^"]*"|@?[\w:-]+|\S)""")
+# Predicate shapes with every literal replaced by _LITERAL
+_LITERAL = "\0"
+_ATTR_EQUALS = re.compile(r"^@([\w:-]+)=\0$")
+_ATTR_EXISTS = re.compile(r"^@([\w:-]+)$")
+_TEXT_EQUALS = re.compile(r"^(text\(\)|\.|normalize-space\(\.?\))=\0$")
+_CONTAINS = re.compile(r"^contains\((text\(\)|\.|@[\w:-]+),\0\)$")
+
+
+def _attribute(tag: Tag, name: str) -> Optional[str]:
+    value = tag.get(name)
+    if isinstance(value, list):
+        return " ".join(value)
+    return value
+
+
+def _own_text(tag: Tag) -> List[str]:
+    return [str(s) for s in tag.find_all(string=True, recursive=False)]
+
+
+def _visible_text(tag: Tag) -> str:
+    return " ".join(tag.get_text(" ").split())
+
+
+def _check_literals(xpath: str) -> None:
+    quote = None
+    for char in xpath:
+        if quote is None and char in "'\"":
+            quote = char
+        elif char == quote:
+            quote = None
+    if quote is not None:
+        ErrorHandler.raise_error(
+            ErrorType.UNSUPPORTED_LOCATOR,
+            xpath,
+            custom_message=f"(unbalanced {quote} literal)",
+        )
+
+
+def _compile_predicate(expression: str, xpath: str) -> Callable[[Tag], bool]:
+    parts = [[]]
+    for token in _TOKEN.findall(expression):
+        if token == "or":
+            ErrorHandler.raise_error(
+                ErrorType.UNSUPPORTED_LOCATOR,
+                xpath,
+                custom_message="('or' predicates, use one locator per option)",
+            )
+        if token == "and":
+            parts.append([])
+        else:
+            parts[-1].append(token)
+    checks = [_compile_condition(part, expression, xpath) for part in parts]
+    if len(checks) == 1:
+        return checks[0]
+    return lambda tag: all(check(tag) for check in checks)
+
+
+def _compile_condition(
+    tokens: List[str], expression: str, xpath: str
+) -> Callable[[Tag], bool]:
+    literals = [token[1:-1] for token in tokens if token[0] in "'\""]
+    shape = "".join(_LITERAL if token[0] in "'\"" else token for token in tokens)
+    value = literals[0] if len(literals) == 1 else None
+
+    if match := _ATTR_EQUALS.match(shape):
+        name = match.group(1)
+        return lambda tag: _attribute(tag, name) == value
+    if match := _ATTR_EXISTS.match(shape):
+        name = match.group(1)
+        return lambda tag: tag.has_attr(name)
+    if match := _TEXT_EQUALS.match(shape):
+        kind = match.group(1)
+        if kind == "text()":
+            return lambda tag: value in _own_text(tag)
+        if kind == ".":
+            return lambda tag: tag.get_text() == value
+        return lambda tag: _visible_text(tag) == value
+    if match := _CONTAINS.match(shape):
+        kind = match.group(1)
+        if kind == "text()":
+            return lambda tag: any(value in text for text in _own_text(tag))
+        if kind == ".":
+            return lambda tag: value in tag.get_text()
+        name = kind[1:]
+        return lambda tag: value in (_attribute(tag, name) or "")
+    ErrorHandler.raise_error(
+        ErrorType.UNSUPPORTED_LOCATOR,
+        xpath,
+        custom_message=f"(predicate [{expression}])",
+    )
+
+
+def _nth_per_parent(tags: List[Tag], position: int) -> List[Tag]:
+    """XPath positions count among siblings, not among all matches."""
+    siblings = {}
+    for tag in tags:
+        siblings.setdefault(id(tag.parent), []).append(tag)
+    return [group[position] for group in siblings.values() if len(group) > position]
+
+
+def _select_xpath(root: Tag, xpath: str) -> List[Tag]:
+    _check_literals(xpath)
+    path = xpath[1:] if xpath.startswith(".") else xpath
+    steps = list(_STEP.finditer(path))
+    if not steps or "".join(step.group(0) for step in steps) != path:
+        ErrorHandler.raise_error(ErrorType.UNSUPPORTED_LOCATOR, xpath)
+
+    context = [root]
+    for step in steps:
+        axis, name, predicates = step.groups()
+        tag_name = True if name == "*" else name
+        filters, position = [], None
+        for predicate in _PREDICATE.findall(predicates):
+            if predicate.strip().isdigit():
+                position = int(predicate) - 1
+            else:
+                filters.append(_compile_predicate(predicate.strip(), xpath))
+
+        found, seen = [], set()
+        for node in context:
+            candidates = node.find_all(tag_name, recursive=axis == "//")
+            candidates = [c for c in candidates if all(f(c) for f in filters)]
+            if position is not None:
+                candidates = _nth_per_parent(candidates, position)
+            for candidate in candidates:
+                if id(candidate) not in seen:
+                    seen.add(id(candidate))
+                    found.append(candidate)
+        context = found
+    return context
+
+
+def _select(root: Tag, by: str, value: str) -> List[Tag]:
+    if by == By.XPATH:
+        return _select_xpath(root, value)
+    if by == By.ID:
+        return root.find_all(id=value)
+    if by == By.NAME:
+        return root.find_all(attrs={"name": value})
+    if by == By.CLASS_NAME:
+        return root.find_all(class_=value)
+    if by == By.TAG_NAME:
+        return root.find_all(value)
+    if by == By.CSS_SELECTOR:
+        return root.select(value)
+    if by == By.LINK_TEXT:
+        return [a for a in root.find_all("a") if _visible_text(a) == value]
+    if by == By.PARTIAL_LINK_TEXT:
+        return [a for a in root.find_all("a") if value in _visible_text(a)]
+    ErrorHandler.raise_error(ErrorType.UNSUPPORTED_LOCATOR, f"{by}={value}")
+
+
+class _ReadOnly:
+    """Anything outside the read-only API needs a real browser."""
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        _browser_required(name)
+
+
+class HttpElement(_ReadOnly):
+    def __init__(self, tag: Tag):
+        self._tag = tag
+
+    @property
+    def tag_name(self) -> str:
+        return self._tag.name
+
+    @property
+    def text(self) -> str:
+        return _visible_text(self._tag)
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        return _attribute(self._tag, name)
+
+    get_dom_attribute = get_attribute
+
+    def is_displayed(self) -> bool:
+        # Only markup is known, hidden inputs and the hidden attribute are not shown
+        style = (_attribute(self._tag, "style") or "").replace(" ", "")
+        return not (
+            self._tag.has_attr("hidden")
+            or _attribute(self._tag, "type") == "hidden"
+            or "display:none" in style
+        )
+
+    def is_enabled(self) -> bool:
+        return not self._tag.has_attr("disabled")
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None):
+        return _first(_select(self._tag, by, value), by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None):
+        return [HttpElement(tag) for tag in _select(self._tag, by, value)]
+
+    def click(self):
+        _browser_required("click")
+
+    def send_keys(self, *value):
+        _browser_required("send_keys")
+
+    def clear(self):
+        _browser_required("clear")
+
+    def submit(self):
+        _browser_required("submit")
+
+
+def _first(tags: List[Tag], by: str, value: str) -> HttpElement:
+    if not tags:
+        raise NoSuchElementException(f"Unable to locate element: {by}={value}")
+    return HttpElement(tags[0])
+
+
+class HttpDriver(_ReadOnly):
+    """
+    Browserless driver for tests that only read server-rendered pages.
+
+    Implements the read-only part of the WebDriver API BasePage relies on
+    (get, title, current_url, find_element and element text/attributes) with
+    pooled requests connections and BeautifulSoup. Everything that needs
+    JavaScript or interaction raises immediately instead of silently passing.
+
+    :param timeout (float): HTTP request timeout in seconds.
+    """
+
+    def __init__(self, timeout: float = 30):
+        self.timeout = timeout
+        self.session_id = None
+        self._url = None
+        self._html = ""
+        self._soup = BeautifulSoup("", "html.parser")
+
+    def get(self, url: str) -> None:
+        response = _get_session().get(url, timeout=self.timeout)
+        response.raise_for_status()
+        self._url = response.url
+        self._html = response.text
+        self._soup = BeautifulSoup(self._html, "html.parser")
+        log.info(f"HTTP-only driver loaded {self._url} ({response.status_code})")
+
+    @property
+    def title(self) -> str:
+        title = self._soup.title
+        return title.get_text().strip() if title else ""
+
+    @property
+    def current_url(self) -> Optional[str]:
+        return self._url
+
+    @property
+    def page_source(self) -> str:
+        return self._html
+
+    def refresh(self) -> None:
+        self.get(self._url)
+
+    def find_element(self, by: str = By.ID, value: Optional[str] = None):
+        return _first(_select(self._soup, by, value), by, value)
+
+    def find_elements(self, by: str = By.ID, value: Optional[str] = None):
+        return [HttpElement(tag) for tag in _select(self._soup, by, value)]
+
+    def maximize_window(self) -> None:
+        pass
+
+    def implicitly_wait(self, time_to_wait: float) -> None:
+        pass
+
+    def execute_script(self, script, *args):
+        _browser_required("execute_script")
+
+    def save_screenshot(self, filename) -> bool:
+        _browser_required("save_screenshot")
+
+    def quit(self) -> None:
+        # The pooled session outlives the driver and is reused by the next test
+        self._soup = None
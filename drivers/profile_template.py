@@ -0,0 +1,196 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import uuid
+from pathlib import Path
+from typing import Callable, Optional
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+# Linux ioctl number for FICLONE (copy-on-write clone of a whole file)
+_FICLONE = 0x40049409
+
+# Lock and socket files the browser leaves behind; copying them into a new
+# session makes the browser think the profile is already in use.
+_SKIP_FILES = {
+    "SingletonLock",
+    "SingletonCookie",
+    "SingletonSocket",
+    "lockfile",
+    "parent.lock",
+    ".parentlock",
+    "lock",
+}
+
+_MARKER = ".template-built"
+
+# Time a superseded template version is kept for workers still cloning it
+_RETIRE_GRACE = 10 * 60
+
+
+def _get_profiles_dir() -> Path:
+    return Path(__file__).resolve().parent.parent / "resources" / "profiles"
+
+
+def _reflink(src: str, dst: str) -> bool:
+    """Clone a file with copy-on-write if the filesystem supports it."""
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with open(src, "rb") as s, open(dst, "wb") as d:
+            fcntl.ioctl(d.fileno(), _FICLONE, s.fileno())
+        shutil.copystat(src, dst)
+        return True
+    except OSError:
+        if os.path.exists(dst):
+            os.unlink(dst)
+        return False
+
+
+class ProfileTemplate:
+    """
+    Warmed browser profile that is built once and cloned for every session.
+
+    The template is a regular user-data-dir populated by a warm-up run (first
+    run setup done, HTTP caches filled). Each session gets its own clone made
+    with copy-on-write where supported and plain copies otherwise; browsers
+    rewrite cache entries in place, so files are never shared with a session.
+
+    Every rebuild is a new immutable version directory. Workers cloning an
+    older version keep reading it, versions are only removed once they are
+    stale for longer than any clone takes.
+
+    :param dr_type (str): Driver type the profile belongs to ('local', 'firefox').
+    :param environment (str): Environment the template was warmed against.
+    :param max_age (int): Seconds after which a template is rebuilt.
+    :param root (Optional[Path]): Directory holding templates and session clones.
+    """
+
+    DEFAULT_MAX_AGE = 24 * 60 * 60
+
+    def __init__(
+        self,
+        dr_type: str,
+        environment: Optional[str] = None,
+        max_age: int = DEFAULT_MAX_AGE,
+        root: Optional[Path] = None,
+    ):
+        self.dr_type = dr_type
+        self.environment = environment or "default"
+        self.max_age = max_age
+        self.root = Path(root) if root else _get_profiles_dir()
+        self.home = self.root / "templates" / f"{dr_type}-{self.environment}"
+        self.sessions_dir = self.root / "sessions"
+        self._reflink_supported = True
+
+    @property
+    def path(self) -> Optional[Path]:
+        """Newest built version of the template, None if none was built."""
+        if not self.home.exists():
+            return None
+        versions = sorted(
+            entry
+            for entry in self.home.iterdir()
+            if entry.name.startswith("v-") and (entry / _MARKER).exists()
+        )
+        return versions[-1] if versions else None
+
+    def is_fresh(self, path: Optional[Path] = None) -> bool:
+        """Check that the template exists and is younger than max_age."""
+        path = path or self.path
+        if path is None:
+            return False
+        try:
+            built = (path / _MARKER).stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return time.time() - built < self.max_age
+
+    def ensure(self, warm: Callable[[str], None]) -> Path:
+        """
+        Build a new template version if the newest one is missing or stale.
+
+        The warm-up callable receives an empty directory and must run the browser
+        against it. The result is renamed into a new version directory, so
+        concurrent xdist workers never see a half-built template.
+        """
+        path = self.path
+        if self.is_fresh(path):
+            return path
+
+        self.home.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=".staging-", dir=self.home))
+        try:
+            log.info(f"Building profile template: {self.home}")
+            warm(str(staging))
+            (staging / _MARKER).touch()
+            version = self.home / f"v-{time.time_ns():020d}-{uuid.uuid4().hex[:8]}"
+            os.rename(staging, version)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return version
+
+    def clone(self, warm: Optional[Callable[[str], None]] = None) -> str:
+        """Return a fresh per-session copy of the template."""
+        source = self.ensure(warm) if warm is not None else self.path
+        if not self.is_fresh(source):
+            raise FileNotFoundError(f"Profile template {self.home} is not built.")
+
+        self.sessions_dir.mkdir(parents=True, exist_ok=True)
+        target = self.sessions_dir / f"{self.dr_type}-{uuid.uuid4().hex}"
+        shutil.copytree(
+            source,
+            target,
+            copy_function=self._copy_file,
+            ignore=lambda _, names: [n for n in names if n in _SKIP_FILES],
+        )
+        # copytree keeps the template's mtime, mark the clone as in use
+        os.utime(target)
+        log.info(f"Cloned profile template into {target}")
+        return str(target)
+
+    def _copy_file(self, src: str, dst: str) -> str:
+        if self._reflink_supported:
+            if _reflink(src, dst):
+                return dst
+            self._reflink_supported = False
+        return shutil.copy2(src, dst)
+
+    def cleanup_stale(self) -> None:
+        """Remove session clones left by crashed runs and retired templates."""
+        now = time.time()
+        if self.sessions_dir.exists():
+            for entry in self.sessions_dir.iterdir():
+                self._remove_if_older(entry, now, self.max_age)
+
+        templates_dir = self.root / "templates"
+        if not templates_dir.exists():
+            return
+        for home in templates_dir.iterdir():
+            if not home.is_dir():
+                continue
+            for entry in home.iterdir():
+                # Nobody clones a stale version, so it is unused after the grace
+                self._remove_if_older(entry, now, self.max_age + _RETIRE_GRACE)
+
+    @staticmethod
+    def _remove_if_older(entry: Path, now: float, max_age: float) -> None:
+        try:
+            age = now - entry.stat().st_mtime
+        except FileNotFoundError:
+            return
+        if age > max_age:
+            log.info(f"Removing stale profile: {entry}")
+            shutil.rmtree(entry, ignore_errors=True)
+
+    @staticmethod
+    def release(profile_dir: Optional[str]) -> None:
+        """Delete a session clone once its browser has quit."""
+        if profile_dir:
+            shutil.rmtree(profile_dir, ignore_errors=True)
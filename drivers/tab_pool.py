@@ -0,0 +1,200 @@
+from typing import Callable, Dict, Optional
+
+from selenium.common.exceptions import WebDriverException
+from urllib3.exceptions import HTTPError
+
+from core_driver.health import SessionHealth
+from core_driver.profile_template import ProfileTemplate
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+# A driver service killed by the watchdog fails below selenium, in urllib3
+_CLOSE_ERRORS = (WebDriverException, HTTPError, OSError)
+
+
+class Tab:
+    """One test's window in the shared session, with its own storage if possible."""
+
+    def __init__(self, pool: "TabPool", handle: str, context_id: Optional[str]):
+        self.pool = pool
+        self.handle = handle
+        self.context_id = context_id
+
+    def activate(self) -> None:
+        self.pool.activate(self.handle)
+
+    def close(self) -> None:
+        self.pool.close(self)
+
+
+class TabDriver:
+    """
+    Driver handed to a test running in a tab of the shared session.
+
+    Every WebDriver call is routed to the test's own window first, so page
+    objects built on it stay bound to that window handle. quit() closes only
+    the tab, the browser is kept for the next test.
+    """
+
+    def __init__(self, tab: Tab):
+        self._tab = tab
+
+    @property
+    def window_handle(self) -> str:
+        return self._tab.handle
+
+    def __getattr__(self, name):
+        driver = self._tab.pool.driver
+        # A miss on EventFiringWebDriver makes the listener take a screenshot
+        if not hasattr(type(driver), name) and not hasattr(
+            self._tab.pool._browser, name
+        ):
+            raise AttributeError(name)
+        self._tab.activate()
+        return getattr(driver, name)
+
+    def quit(self) -> None:
+        self._tab.close()
+
+
+class TabPool:
+    """
+    One browser session per xdist worker, reused by its tests through tabs.
+
+    pytest runs one test at a time per worker, so the pool normally holds a
+    single test tab: it saves the browser start of every test, it does not
+    run tests concurrently.
+
+    Chromium tabs are opened in their own browser context through CDP
+    (Target.createBrowserContext), which keeps cookies, storage and cache
+    apart like separate browsers do, at the cost of a tab instead of a
+    process tree. Other browsers get a plain new tab; when it closes only the
+    cookies and web storage of the origin it was on are cleared, so tests
+    that need full isolation there should use their own browser.
+
+    Before each tab the session gets a liveness check, a dead or hung browser
+    is killed and replaced before the test starts instead of failing it.
+
+    :param create_driver (Callable): Starts the shared session, already configured.
+    :param governor: MemoryGovernor that may recycle the session between tests.
+    """
+
+    def __init__(self, create_driver: Callable, governor=None):
+        self.create_driver = create_driver
+        self.governor = governor
+        self.driver = None
+        self.health: Optional[SessionHealth] = None
+        self.tabs: Dict[str, Tab] = {}
+        self._home_handle = None
+        self._active_handle = None
+
+    @property
+    def _browser(self):
+        # Unwrap EventFiringWebDriver for CDP and process inspection
+        return getattr(self.driver, "wrapped_driver", self.driver)
+
+    def _ensure_session(self) -> None:
+        if self.driver is not None and not self.health.is_alive():
+            log.warning(f"Session {self.driver.session_id} died, replacing it")
+            self.quit()
+        if self.driver is not None and not self.tabs and self.governor:
+            self.governor.recycle_if_needed(self.driver, lambda _: self.quit())
+        if self.driver is None:
+            self.driver = self.create_driver()
+            self.health = SessionHealth(self.driver).start()
+        if self._home_handle is None:
+            # Never closed, the session ends when its last window does
+            self._home_handle = self.driver.current_window_handle
+            self._active_handle = self._home_handle
+
+    def activate(self, handle: str) -> None:
+        # Tracked locally, switching only costs a round trip when it changes
+        if handle != self._active_handle:
+            self.driver.switch_to.window(handle)
+            self._active_handle = handle
+
+    def _open_isolated(self, url: str):
+        browser = self._browser
+        if not hasattr(browser, "execute_cdp_cmd"):
+            return None, None
+        try:
+            context_id = browser.execute_cdp_cmd(
+                "Target.createBrowserContext", {"disposeOnDetach": True}
+            )["browserContextId"]
+            target_id = browser.execute_cdp_cmd(
+                "Target.createTarget", {"url": url, "browserContextId": context_id}
+            )["targetId"]
+        except WebDriverException as e:
+            log.warning(f"Isolated browser context not available: {e}")
+            return None, None
+        # chromedriver uses the target id as window handle
+        if target_id not in self.driver.window_handles:
+            browser.execute_cdp_cmd("Target.closeTarget", {"targetId": target_id})
+            browser.execute_cdp_cmd(
+                "Target.disposeBrowserContext", {"browserContextId": context_id}
+            )
+            return None, None
+        return target_id, context_id
+
+    def open(self, url: str) -> TabDriver:
+        """Open url in a new tab of the shared session and return its driver."""
+        self._ensure_session()
+        handle, context_id = self._open_isolated(url)
+        if handle is None:
+            self.driver.switch_to.new_window("tab")
+            handle = self.driver.current_window_handle
+            self._active_handle = handle
+            self.driver.get(url)
+        else:
+            self.activate(handle)
+        tab = Tab(self, handle, context_id)
+        self.tabs[handle] = tab
+        log.info(f"Opened tab {handle} in session {self.driver.session_id}")
+        return TabDriver(tab)
+
+    def close(self, tab: Tab) -> None:
+        if self.tabs.pop(tab.handle, None) is None:
+            return
+        self._active_handle = None
+        if not self.health.is_alive():
+            # Nothing left to close, the next open() replaces the session
+            log.warning(f"Dropped tab {tab.handle} of a dead session")
+            return
+        try:
+            self.activate(tab.handle)
+            if tab.context_id is None:
+                self._clear_origin()
+            self.driver.close()
+            if tab.context_id is not None:
+                self._browser.execute_cdp_cmd(
+                    "Target.disposeBrowserContext",
+                    {"browserContextId": tab.context_id},
+                )
+            self.activate(self._home_handle)
+        except _CLOSE_ERRORS as e:
+            log.warning(f"Failed to close tab {tab.handle}: {e}")
+
+    def _clear_origin(self) -> None:
+        """Clear cookies and web storage of the shared tab's current origin."""
+        try:
+            self.driver.execute_script(
+                "window.localStorage.clear(); window.sessionStorage.clear();"
+            )
+        except WebDriverException as e:
+            # Pages such as about:blank have no storage to clear
+            log.debug(f"Web storage not cleared: {e}")
+        self.driver.delete_all_cookies()
+
+    def quit(self) -> None:
+        driver, health = self.driver, self.health
+        profile_dir = getattr(self._browser, "profile_dir", None)
+        # Forget the session first, a failed kill must not leave it reusable
+        self.driver = self.health = None
+        self.tabs.clear()
+        self._home_handle = self._active_handle = None
+        if driver is not None:
+            try:
+                health.close(driver)
+            finally:
+                ProfileTemplate.release(profile_dir)
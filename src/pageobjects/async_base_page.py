@@ -0,0 +1,106 @@
+import asyncio
+import time
+from typing import Literal, Optional
+
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from core_driver.async_driver import AsyncWebDriver, AsyncWebElement
+from src.pageobjects.base_page import Locator, WaitType
+
+
+class AsyncBasePage:
+    """Awaitable counterpart of BasePage for AsyncWebDriver sessions."""
+
+    POLL_FREQUENCY = 0.5
+
+    def __init__(self, driver: AsyncWebDriver):
+        self.driver = driver
+
+    async def _check(self, locator: Locator, condition: str):
+        element = await self.driver.find_element(*locator)
+        if condition == "present":
+            return element
+        if not await element.is_displayed():
+            return None
+        if condition == "clickable" and not await element.is_enabled():
+            return None
+        return element
+
+    async def wait_for(
+        self,
+        locator: Locator,
+        condition: Literal["clickable", "visible", "present"] = "visible",
+        wait_type: Optional[WaitType] = None,
+    ) -> AsyncWebElement:
+        """Wait for an element"""
+        if condition not in ("clickable", "visible", "present"):
+            raise ValueError(f"Unknown condition: {condition}")
+
+        timeout = (wait_type or WaitType.DEFAULT).value
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                element = await self._check(locator, condition)
+                if element is not None:
+                    return element
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+            if time.monotonic() > deadline:
+                raise TimeoutException(
+                    f"Condition '{condition}' failed for element {locator} "
+                    f"after {timeout} seconds"
+                )
+            await asyncio.sleep(self.POLL_FREQUENCY)
+
+    async def click(
+        self,
+        locator: Locator,
+        condition: Literal["clickable", "visible", "present"] = "clickable",
+        wait_type: Optional[WaitType] = None,
+    ):
+        """
+        Click on an element.
+        """
+        element = await self.wait_for(locator, condition, wait_type)
+        await element.click()
+
+    async def set(
+        self, locator: Locator, text: str, wait_type: Optional[WaitType] = None
+    ):
+        """
+        Set text in an input field.
+        """
+        element = await self.wait_for(locator, wait_type=wait_type)
+        await element.clear()
+        await element.send_keys(text)
+
+    async def get_text(
+        self, locator: Locator, wait_type: Optional[WaitType] = None
+    ) -> str:
+        """
+        Get the text of an element.
+        """
+        element = await self.wait_for(locator, "present", wait_type)
+        return await element.text()
+
+    async def get_title(self) -> str:
+        """
+        Get the page title.
+        """
+        return await self.driver.title()
+
+    async def navigate_to(self, url):
+        """Navigate to a specific URL."""
+        await self.driver.get(url)
+
+    async def get_current_url(self):
+        """Get the current URL of the page."""
+        return await self.driver.current_url()
+
+    async def refresh(self):
+        """Refresh the current page."""
+        await self.driver.refresh()
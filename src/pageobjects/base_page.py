@@ -1,12 +1,16 @@
+import base64
 from enum import Enum
-from typing import Tuple, Optional, Literal
+from typing import Tuple, Optional, Literal, Sequence
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support import expected_conditions as ec
 from selenium.webdriver.support.wait import WebDriverWait
 from selenium.common.exceptions import TimeoutException, ElementNotVisibleException
 
+from core_driver.http_driver import HttpDriver
 from utils.helpers import timing
 from utils.logger import log
+from utils.retry import ACTION_POLICY
+from utils.visual import Region, VisualDiff, check_visual
 
 # Type alias for locators
 Locator = Tuple[str, str]
@@ -22,12 +26,15 @@ class WaitType(Enum):
 class BasePage:
     def __init__(self, driver):
         self.driver = driver
-        self._wait = WebDriverWait(driver, WaitType.DEFAULT.value)
-        self._short_wait = WebDriverWait(driver, WaitType.SHORT.value)
-        self._long_wait = WebDriverWait(driver, WaitType.LONG.value)
+        # Static HTML from the HTTP-only driver never changes, check it once.
+        # No attribute probing, on EventFiringWebDriver it takes a screenshot
+        scale = 0 if isinstance(driver, HttpDriver) else 1
+        self._wait = WebDriverWait(driver, WaitType.DEFAULT.value * scale)
+        self._short_wait = WebDriverWait(driver, WaitType.SHORT.value * scale)
+        self._long_wait = WebDriverWait(driver, WaitType.LONG.value * scale)
         self._fluent_wait = WebDriverWait(
             driver,
-            WaitType.FLUENT.value,
+            WaitType.FLUENT.value * scale,
             poll_frequency=1,
             ignored_exceptions=[ElementNotVisibleException],
         )
@@ -71,6 +78,7 @@ class BasePage:
                 f"after {waiter._timeout} seconds"
             ) from e
 
+    @ACTION_POLICY
     def click(
         self,
         locator: Locator,
@@ -86,6 +94,7 @@ class BasePage:
 
     # @log()
     # @timing
+    @ACTION_POLICY
     def set(self, locator: Locator, text: str, wait_type: Optional[WaitType] = None):
         """
         Set text in an input field.
@@ -95,7 +104,8 @@ class BasePage:
         element.clear()
         element.send_keys(text)
 
-    @log
+    @log()
+    @ACTION_POLICY
     def get_text(
         self, locator: Locator, wait_type: Optional[WaitType] = None
     ) -> str:
@@ -127,3 +137,46 @@ class BasePage:
     def scroll_to_element(self, element):
         """Sroll to element"""
         self.driver.execute_script("arguments[0].scrollIntoView();", element)
+
+    def _full_page_png(self) -> bytes:
+        """Screenshot of the whole document, falling back to the viewport."""
+        # Unwrapped, a missing attribute on EventFiringWebDriver takes a screenshot
+        driver = getattr(self.driver, "wrapped_driver", self.driver)
+        if hasattr(driver, "get_full_page_screenshot_as_png"):
+            # Firefox
+            return driver.get_full_page_screenshot_as_png()
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium
+            result = driver.execute_cdp_cmd(
+                "Page.captureScreenshot",
+                {"format": "png", "captureBeyondViewport": True},
+            )
+            return base64.b64decode(result["data"])
+        return self.driver.get_screenshot_as_png()
+
+    def _element_region(self, locator: Locator) -> Region:
+        """Page region of an element in screenshot pixels."""
+        element = self.wait_for(locator, condition="present")
+        ratio = self.driver.execute_script("return window.devicePixelRatio") or 1
+        rect = element.rect
+        return (
+            int(rect["x"] * ratio),
+            int(rect["y"] * ratio),
+            int(rect["width"] * ratio + 0.5),
+            int(rect["height"] * ratio + 0.5),
+        )
+
+    @log()
+    def checkpoint(
+        self,
+        name: str,
+        masks: Sequence[Locator] = (),
+        max_diff_ratio: Optional[float] = None,
+    ) -> VisualDiff:
+        """
+        Compare a full page screenshot with its stored baseline.
+        """
+        regions = [self._element_region(locator) for locator in masks]
+        return check_visual(
+            name, self._full_page_png(), regions, max_diff_ratio=max_diff_ratio
+        )
@@ -0,0 +1,9 @@
+from src.pageobjects.text.fill_form import FillForm
+from utils.data_driven import data_driven
+
+
+class TestFillFormData:
+    @data_driven("users.csv", id_keys=("username",))
+    def test_fill_user_from_data(self, make_driver, data_row):
+        fill = FillForm(make_driver)
+        fill.enter_username(f"{data_row['first_name']} {data_row['last_name']}")
@@ -0,0 +1,150 @@
+import asyncio
+import json
+import subprocess
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    SessionNotCreatedException,
+)
+
+from core_driver.async_driver import (
+    AsyncDriverService,
+    AsyncW3CConnection,
+    AsyncWebDriver,
+)
+from src.locators.locators import General
+from src.pageobjects.async_base_page import AsyncBasePage
+
+# Spelled out on purpose, this is what chromedriver and geckodriver send
+SPEC_ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class W3CStub(BaseHTTPRequestHandler):
+    """One session, one page with a single 'Elements' heading."""
+
+    protocol_version = "HTTP/1.1"
+    clicks = []
+    refuse_sessions = False
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, value=None, status=200):
+        body = json.dumps({"value": value}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _route(self, method):
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        command = self.path.split("/session/s1", 1)[-1]
+        if method == "POST" and self.path == "/session":
+            if self.refuse_sessions:
+                return self._reply(
+                    {"error": "session not created", "message": "no Chrome"}, 500
+                )
+            return self._reply({"sessionId": "s1", "capabilities": {}})
+        if command == "/element":
+            if payload["value"] == General.ELEMENTS[1]:
+                return self._reply({SPEC_ELEMENT_KEY: "e1"})
+            return self._reply(
+                {"error": "no such element", "message": payload["value"]}, 404
+            )
+        if command == "/title":
+            return self._reply("Demo")
+        if command in ("/element/e1/displayed", "/element/e1/enabled"):
+            return self._reply(True)
+        if command == "/element/e1/text":
+            return self._reply("Elements")
+        if command == "/element/e1/click":
+            self.clicks.append("e1")
+        return self._reply(None)
+
+    def do_GET(self):  # noqa: N802
+        self._route("GET")
+
+    def do_POST(self):  # noqa: N802
+        self._route("POST")
+
+    def do_DELETE(self):  # noqa: N802
+        self._route("DELETE")
+
+
+@pytest.fixture
+def w3c_stub():
+    W3CStub.clicks = []
+    W3CStub.refuse_sessions = False
+    server = ThreadingHTTPServer(("127.0.0.1", 0), W3CStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server.server_address
+    server.shutdown()
+    server.server_close()
+
+
+def _run_page(address, scenario):
+    async def _session():
+        driver = await AsyncWebDriver.create(AsyncW3CConnection(*address), {})
+        try:
+            return await scenario(AsyncBasePage(driver))
+        finally:
+            await driver.quit()
+
+    return asyncio.run(_session())
+
+
+class TestAsyncDriver:
+    def test_page_reads_spec_element_references(self, w3c_stub):
+        async def scenario(page):
+            await page.click(General.ELEMENTS)
+            return await page.get_text(General.ELEMENTS), await page.get_title()
+
+        assert _run_page(w3c_stub, scenario) == ("Elements", "Demo")
+        assert W3CStub.clicks == ["e1"]
+
+    def test_missing_element_maps_to_selenium_error(self, w3c_stub):
+        async def scenario(page):
+            await page.driver.find_element(*General.STORE)
+
+        with pytest.raises(NoSuchElementException):
+            _run_page(w3c_stub, scenario)
+
+    def test_service_rejects_non_chrome_types(self):
+        with pytest.raises(ValueError, match="firefox"):
+            AsyncDriverService(dr_type="firefox")
+
+    def test_failed_session_closes_its_connection(self, w3c_stub):
+        W3CStub.refuse_sessions = True
+        connection = AsyncW3CConnection(*w3c_stub)
+
+        async def create():
+            await AsyncWebDriver.create(connection, {})
+
+        with pytest.raises(SessionNotCreatedException):
+            asyncio.run(create())
+        assert connection._idle == []
+
+    def test_stop_kills_a_hung_service(self, monkeypatch):
+        service = AsyncDriverService(dr_type="local")
+        # Ignores SIGTERM like a chromedriver stuck on its browser
+        service.process = subprocess.Popen([
+            sys.executable, "-c",
+            "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); "
+            "print(flush=True); time.sleep(60)",
+        ], stdout=subprocess.PIPE)
+        service.process.stdout.readline()
+        process = service.process
+        wait = process.wait
+        monkeypatch.setattr(
+            process, "wait", lambda timeout=None: wait(min(timeout or 5, 0.5))
+        )
+
+        service.stop()
+        assert process.returncode == -9
+        assert service.process is None
@@ -0,0 +1,19 @@
+import asyncio
+
+from src.locators.locators import General
+from src.pageobjects.async_base_page import AsyncBasePage
+
+
+class TestAsyncMain:
+    def test_concurrent_sessions(self, make_async_driver):
+        async def open_main_page():
+            async with make_async_driver() as driver:
+                page = AsyncBasePage(driver)
+                await page.wait_for(General.ELEMENTS)
+                return await page.get_title()
+
+        async def run_sessions(count):
+            return await asyncio.gather(*(open_main_page() for _ in range(count)))
+
+        titles = asyncio.run(run_sessions(3))
+        assert len(set(titles)) == 1
@@ -0,0 +1,119 @@
+import openpyxl
+import pytest
+
+from utils import data_driven
+from utils.data_driven import iter_refs, load_row
+
+
+@pytest.fixture(autouse=True)
+def fresh_cursors(monkeypatch):
+    monkeypatch.setattr(data_driven, "_cursors", {})
+
+
+@pytest.fixture
+def users_csv(tmp_path):
+    path = tmp_path / "users.csv"
+    path.write_text(
+        "username,note\n"
+        'ann,"first line\nsecond line"\n'
+        "\n"
+        "bob,plain\n"
+        'cid,"quoted, comma"\n',
+        encoding="UTF-8",
+    )
+    return str(path)
+
+
+@pytest.fixture
+def users_xlsx(tmp_path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    for values in (
+        ("username", "age"),
+        ("ann", 31),
+        (None, None),
+        ("bob", 42),
+        ("cid", 27),
+    ):
+        sheet.append(values)
+    path = tmp_path / "users.xlsx"
+    workbook.save(path)
+    return str(path)
+
+
+@pytest.fixture
+def opened_workbooks(monkeypatch):
+    opened = []
+    load_workbook = openpyxl.load_workbook
+
+    def counting(*args, **kwargs):
+        opened.append(args[0])
+        return load_workbook(*args, **kwargs)
+
+    monkeypatch.setattr(openpyxl, "load_workbook", counting)
+    return opened
+
+
+class TestDataDriven:
+    def test_csv_refs_point_at_record_offsets(self, users_csv):
+        refs = list(iter_refs(users_csv, id_keys=("username",)))
+
+        assert [ref.id for ref in refs] == ["ann", "bob", "cid"]
+        assert [ref.index for ref in refs] == [0, 1, 2]
+        assert load_row(refs[0]) == {
+            "username": "ann",
+            "note": "first line\nsecond line",
+        }
+        assert load_row(refs[2]) == {"username": "cid", "note": "quoted, comma"}
+        assert load_row(refs[1]) == {"username": "bob", "note": "plain"}
+
+    def test_xlsx_rows_skip_empty_sheet_rows(self, users_xlsx):
+        refs = list(iter_refs(users_xlsx, id_keys=("username",)))
+
+        assert [ref.id for ref in refs] == ["ann", "bob", "cid"]
+        assert {ref.offset for ref in refs} == {None}
+        assert [load_row(ref) for ref in refs] == [
+            {"username": "ann", "age": 31},
+            {"username": "bob", "age": 42},
+            {"username": "cid", "age": 27},
+        ]
+
+    def test_xlsx_is_read_forward_once(self, users_xlsx, opened_workbooks):
+        refs = list(iter_refs(users_xlsx))
+        opened_workbooks.clear()
+
+        load_row(refs[0])
+        cursor = data_driven._cursors[users_xlsx]
+        for ref in refs[1:]:
+            load_row(ref)
+        assert len(opened_workbooks) == 1
+        # Closed with the last row, not at the end of the session
+        assert cursor.rows.gi_frame is None
+        assert data_driven._cursors == {}
+
+        # Reruns or reordered tests start a new pass instead of failing
+        assert load_row(refs[0])["username"] == "ann"
+        assert len(opened_workbooks) == 2
+
+    def test_yaml_sequences_and_documents(self, tmp_path):
+        path = tmp_path / "users.yaml"
+        path.write_text(
+            "- username: ann\n"
+            "- username: bob\n"
+            "---\n"
+            "username: cid\n",
+            encoding="UTF-8",
+        )
+        refs = list(iter_refs(str(path), id_keys=("username",)))
+
+        assert [ref.id for ref in refs] == ["ann", "bob", "cid"]
+        assert {ref.offset for ref in refs} == {None}
+        assert load_row(refs[1]) == {"username": "bob"}
+        assert load_row(refs[2]) == {"username": "cid"}
+        assert load_row(refs[0]) == {"username": "ann"}
+
+    def test_unsupported_source(self, tmp_path):
+        path = tmp_path / "users.json"
+        path.write_text("[]", encoding="UTF-8")
+        with pytest.raises(ValueError, match="users.json"):
+            list(iter_refs(str(path)))
@@ -0,0 +1,177 @@
+import hashlib
+import io
+import json
+import threading
+import zipfile
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.cli import main
+
+DRIVER = b"\x7fELF fake chromedriver" * 4096
+
+
+class RangeHandler(SimpleHTTPRequestHandler):
+    """Static mirror that honours single byte ranges like a CDN does."""
+
+    ranges = []
+
+    def do_GET(self):  # noqa: N802
+        header = self.headers.get("Range")
+        path = self.translate_path(self.path)
+        if not header or not path.endswith(".zip"):
+            return super().do_GET()
+        self.ranges.append(header)
+        with open(path, "rb") as fh:
+            data = fh.read()
+        start = int(header.split("=")[1].rstrip("-"))
+        if start >= len(data):
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{len(data)}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(206)
+        self.send_header(
+            "Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}"
+        )
+        self.send_header("Content-Length", str(len(data) - start))
+        self.end_headers()
+        self.wfile.write(data[start:])
+
+    def log_message(self, *args):
+        pass
+
+
+def _archive() -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("chromedriver-linux64/LICENSE.chromedriver", "license")
+        zf.writestr("chromedriver-linux64/chromedriver", DRIVER)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    root = tmp_path / "mirror"
+    archive = _archive()
+    milestones = {}
+    for milestone in ("129", "130"):
+        version = f"{milestone}.0.6668.100"
+        url = f"{version}/linux64/chromedriver-linux64.zip"
+        (root / version / "linux64").mkdir(parents=True)
+        (root / url).write_bytes(archive)
+        milestones[milestone] = {
+            "milestone": milestone,
+            "version": version,
+            "downloads": {
+                "chromedriver": [{"platform": "linux64", "url": url}],
+            },
+        }
+    # One checksum in the manifest, the other in a sidecar file
+    digest = hashlib.sha256(archive).hexdigest()
+    milestones["129"]["downloads"]["chromedriver"][0]["sha256"] = digest
+    (root / "130.0.6668.100/linux64/chromedriver-linux64.zip.sha256").write_text(
+        f"{digest}  chromedriver-linux64.zip\n"
+    )
+    (root / "latest-versions-per-milestone-with-downloads.json").write_text(
+        json.dumps({"milestones": milestones})
+    )
+
+    RangeHandler.ranges = []
+    server = ThreadingHTTPServer(
+        ("127.0.0.1", 0), partial(RangeHandler, directory=str(root))
+    )
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", root
+    server.shutdown()
+    server.server_close()
+
+
+def _sync(url, store, milestones="129,130"):
+    with pytest.raises(SystemExit) as exit_info:
+        main([
+            "sync", "--milestones", milestones, "--mirror", url,
+            "--platform", "linux64", "--store", str(store),
+        ])
+    return exit_info.value.code
+
+
+class TestDriverStore:
+    def test_sync_stores_binaries_by_content(self, mirror, tmp_path):
+        url, _ = mirror
+        store = tmp_path / "store"
+        assert _sync(url, store) == 0
+
+        index = json.loads((store / "index.json").read_text())
+        digest = hashlib.sha256(DRIVER).hexdigest()
+        assert {m: e["sha256"] for m, e in index["chromedriver"].items()} == {
+            "129": digest,
+            "130": digest,
+        }
+        # Identical binaries are stored once
+        assert (store / "objects" / digest[:2] / digest).read_bytes() == DRIVER
+        assert len(list((store / "objects").rglob("*"))) == 2
+
+    def test_sync_resumes_partial_download(self, mirror, tmp_path):
+        url, root = mirror
+        store = tmp_path / "store"
+        archive = root / "129.0.6668.100/linux64/chromedriver-linux64.zip"
+        archive = archive.read_bytes()
+        part = store / "parts" / "chromedriver-129.0.6668.100-linux64.zip.part"
+        part.parent.mkdir(parents=True)
+        half = len(archive) // 2
+        part.write_bytes(archive[:half])
+
+        assert _sync(url, store, milestones="129") == 0
+        assert RangeHandler.ranges == [f"bytes={half}-"]
+        assert not part.exists()
+
+    def test_sync_rejects_checksum_mismatch(self, mirror, tmp_path):
+        url, root = mirror
+        (root / "130.0.6668.100/linux64/chromedriver-linux64.zip.sha256").write_text(
+            "0" * 64
+        )
+        store = tmp_path / "store"
+        assert _sync(url, store) == 1
+
+        index = json.loads((store / "index.json").read_text())
+        assert list(index["chromedriver"]) == ["129"]
+
+    def test_sync_discards_part_larger_than_archive(self, mirror, tmp_path):
+        url, root = mirror
+        store = tmp_path / "store"
+        archive = root / "129.0.6668.100/linux64/chromedriver-linux64.zip"
+        part = store / "parts" / "chromedriver-129.0.6668.100-linux64.zip.part"
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"x" * (archive.stat().st_size + 10))
+
+        assert _sync(url, store, milestones="129") == 0
+        assert RangeHandler.ranges[0] == f"bytes={archive.stat().st_size + 10}-"
+        assert not part.exists()
+
+    def test_sync_discards_corrupt_part(self, mirror, tmp_path):
+        url, root = mirror
+        # Without a published checksum only the zip CRCs catch the corruption
+        (root / "130.0.6668.100/linux64/chromedriver-linux64.zip.sha256").unlink()
+        store = tmp_path / "store"
+        archive = root / "130.0.6668.100/linux64/chromedriver-linux64.zip"
+        part = store / "parts" / "chromedriver-130.0.6668.100-linux64.zip.part"
+        part.parent.mkdir(parents=True)
+        part.write_bytes(b"x" * archive.stat().st_size)
+
+        assert _sync(url, store, milestones="130") == 1
+        assert not part.exists()
+        assert _sync(url, store, milestones="130") == 0
+
+    def test_sync_reports_unknown_milestone(self, mirror, tmp_path, capsys):
+        url, _ = mirror
+        assert _sync(url, tmp_path / "store", milestones="99") == 1
+        assert "Milestone 99 is not in" in capsys.readouterr().out
+
+    def test_sync_reports_unreachable_mirror(self, tmp_path, capsys):
+        # Nothing listens on the discard port
+        assert _sync("http://127.0.0.1:9/", tmp_path / "store") == 1
+        assert capsys.readouterr().out.startswith("sync failed:")
@@ -0,0 +1,75 @@
+import pytest
+
+from core_driver.governor import MemoryGovernor
+
+
+@pytest.fixture
+def governor(tmp_path, monkeypatch):
+    governor = MemoryGovernor(
+        max_sessions=2, min_available_mb=512, timeout=0, lock_dir=tmp_path
+    )
+    monkeypatch.setattr(governor, "POLL_INTERVAL", 0.01)
+    monkeypatch.setattr(governor, "host_available_mb", lambda: 4096.0)
+    return governor
+
+
+class TestMemoryGovernor:
+    def test_slots_are_exclusive_until_released(self, governor):
+        first = governor.acquire()
+        second = governor.acquire()
+        assert {first.slot, second.slot} == {0, 1}
+
+        with pytest.raises(TimeoutError, match="2 sessions"):
+            governor.acquire()
+
+        second.release()
+        third = governor.acquire()
+        assert third.slot == second.slot
+
+        # Releasing twice is harmless, teardown may run after a recycle
+        third.release()
+        third.release()
+        first.release()
+
+    def test_slots_are_shared_with_other_governors(self, governor, tmp_path):
+        # Another xdist worker on the same host uses the same lock dir
+        other = MemoryGovernor(max_sessions=2, timeout=0, lock_dir=tmp_path)
+        other.host_available_mb = lambda: 4096.0
+        permits = [governor.acquire(), governor.acquire()]
+
+        with pytest.raises(TimeoutError):
+            other.acquire()
+        for permit in permits:
+            permit.release()
+        other.acquire().release()
+
+    def test_memory_pressure_blocks_acquire(self, governor, monkeypatch):
+        monkeypatch.setattr(governor, "host_available_mb", lambda: 100.0)
+        assert governor.under_pressure()
+        with pytest.raises(TimeoutError, match="100 MB available"):
+            governor.acquire()
+
+    def test_acquire_waits_for_memory(self, governor, monkeypatch):
+        readings = iter([100.0, 100.0, 4096.0])
+        monkeypatch.setattr(
+            governor, "host_available_mb", lambda: next(readings, 4096.0)
+        )
+        governor.timeout = 5
+
+        permit = governor.acquire()
+        assert next(readings, None) is None
+        permit.release()
+
+    def test_recycle_only_past_the_rss_limit(self, governor, monkeypatch):
+        quit_calls = []
+        driver = type("Driver", (), {"session_id": "s1"})()
+
+        monkeypatch.setattr(governor, "session_rss_mb", lambda d: 1024.0)
+        assert not governor.recycle_if_needed(driver, quit_calls.append)
+
+        monkeypatch.setattr(governor, "session_rss_mb", lambda d: 4096.0)
+        assert governor.recycle_if_needed(driver, quit_calls.append)
+        assert quit_calls == [driver]
+
+    def test_remote_sessions_have_no_rss(self):
+        assert MemoryGovernor.session_rss_mb(object()) == 0.0
@@ -0,0 +1,135 @@
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import psutil
+import pytest
+
+from core_driver.health import SessionHealth
+
+# A driver service that starts one "browser" child and waits
+SERVICE = (
+    "import subprocess, sys, time; "
+    "p = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)']); "
+    "print(p.pid, flush=True); time.sleep(60)"
+)
+
+
+class DriverStub(BaseHTTPRequestHandler):
+    """Answers the liveness probe with the configured behaviour."""
+
+    behaviour = "ok"
+
+    def do_GET(self):  # noqa: N802
+        if self.behaviour == "hang":
+            time.sleep(2)
+        status, body = (200, b'{"value": ["w1"]}')
+        if self.behaviour == "missing":
+            status, body = 404, b'{"value": {"error": "invalid session id"}}'
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeDriver:
+    def __init__(self, url=None, process=None):
+        self.session_id = "s1"
+        self.command_executor = SimpleNamespace(_url=url)
+        self.service = SimpleNamespace(process=process)
+        self.quit_calls = 0
+
+    def quit(self):
+        self.quit_calls += 1
+
+
+@pytest.fixture
+def driver_url():
+    DriverStub.behaviour = "ok"
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DriverStub)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def service():
+    process = subprocess.Popen(
+        [sys.executable, "-c", SERVICE], stdout=subprocess.PIPE
+    )
+    browser_pid = int(process.stdout.readline())
+    yield process
+    process.kill()
+    process.wait()
+    process.stdout.close()
+    try:
+        psutil.Process(browser_pid).kill()
+    except psutil.NoSuchProcess:
+        pass
+
+
+class TestSessionHealth:
+    def test_probe_ok(self, driver_url):
+        assert SessionHealth(FakeDriver(driver_url)).probe()
+
+    def test_probe_unknown_session(self, driver_url):
+        DriverStub.behaviour = "missing"
+        assert not SessionHealth(FakeDriver(driver_url)).probe()
+
+    def test_probe_hung_driver_fails_fast(self, driver_url):
+        DriverStub.behaviour = "hang"
+        health = SessionHealth(FakeDriver(driver_url), probe_timeout=0.2)
+
+        started = time.monotonic()
+        assert not health.probe()
+        assert time.monotonic() - started < 1.5
+
+    def test_probe_without_executor(self):
+        assert not SessionHealth(FakeDriver()).probe()
+
+    def test_remote_sessions_count_as_alive(self):
+        health = SessionHealth(FakeDriver())
+        assert health.processes == []
+        assert health.is_alive()
+
+    def test_processes_alive_tracks_the_service_tree(self, driver_url, service):
+        health = SessionHealth(FakeDriver(driver_url, service))
+        assert len(health.processes) == 2
+        assert health.processes_alive()
+        assert health.is_alive()
+
+        # Not reaped by its parent, the browser lingers as a zombie
+        health.processes[1].kill()
+        time.sleep(0.2)
+        assert not health.processes_alive()
+        assert not health.is_alive()
+
+    def test_close_quits_a_live_session(self, driver_url, service):
+        driver = FakeDriver(driver_url, service)
+        SessionHealth(driver).close(driver)
+        assert driver.quit_calls == 1
+
+    def test_close_kills_a_dead_session(self, driver_url, service):
+        driver = FakeDriver(driver_url, service)
+        health = SessionHealth(driver)
+        DriverStub.behaviour = "missing"
+
+        health.close(driver)
+        assert driver.quit_calls == 0
+        assert service.wait(5) == -9
+
+    def test_watchdog_kills_service_when_browser_dies(self, driver_url, service):
+        health = SessionHealth(FakeDriver(driver_url, service), interval=0.05)
+        health.start()
+        try:
+            health.processes[1].kill()
+            assert service.wait(5) == -9
+        finally:
+            health.stop()
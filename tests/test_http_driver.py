@@ -0,0 +1,138 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from bs4 import BeautifulSoup
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.common.by import By
+
+from core_driver.http_driver import HttpDriver, _select
+from src.locators.locators import General
+from src.pageobjects.base_page import BasePage
+
+PAGE = """<!DOCTYPE html>
+<html><head><title> Demo </title></head>
+<body>
+<div class="card-body"><h5>Elements</h5></div>
+<div class="card-body"><h5>Forms</h5></div>
+<div class="card-body"><h5>Book Store Application</h5></div>
+<ul id="menu">
+  <li><a href="/terms" class="link footer">Terms and Conditions</a></li>
+  <li><a href="/privacy" data-id='say "hi"'>Privacy</a></li>
+  <li><a href="/or">A or B</a></li>
+</ul>
+<p id="a">first</p><p id="b">second <b>bold</b></p>
+<input type="hidden" name="token" value="x">
+<button disabled>Send</button>
+</body></html>
+"""
+
+
+class PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):  # noqa: N802
+        body = PAGE.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def soup():
+    return BeautifulSoup(PAGE, "html.parser")
+
+
+@pytest.fixture
+def http_driver():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), PageHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    driver = HttpDriver(timeout=5)
+    driver.get(f"http://127.0.0.1:{server.server_address[1]}/")
+    yield driver
+    driver.quit()
+    server.shutdown()
+    server.server_close()
+
+
+def _texts(tags):
+    return [" ".join(tag.get_text().split()) for tag in tags]
+
+
+class TestXPathSubset:
+    @pytest.mark.parametrize(
+        "xpath, expected",
+        [
+            ("//a[text()='Terms and Conditions']", ["Terms and Conditions"]),
+            ("//a[.='A or B']", ["A or B"]),
+            ("//a[@data-id='say \"hi\"']", ["Privacy"]),
+            (
+                "//a[@class='link footer' and @href='/terms']",
+                ["Terms and Conditions"],
+            ),
+            ("//a[@href and contains(text(), 'and')]", ["Terms and Conditions"]),
+            ("//p[normalize-space()='second bold']", ["second bold"]),
+            ("//p[contains(@id, 'b')]", ["second bold"]),
+            ("//div[@class='card-body']//h5[text()='Forms']", ["Forms"]),
+            ("//ul[@id='menu']/li[2]/a", ["Privacy"]),
+            ("//ul/li/a[@href='/missing']", []),
+        ],
+    )
+    def test_supported_predicates(self, soup, xpath, expected):
+        assert _texts(_select(soup, By.XPATH, xpath)) == expected
+
+    @pytest.mark.parametrize(
+        "xpath, reason",
+        [
+            ("//p[@id='a' or @id='b']", "'or' predicates"),
+            ("//p[starts-with(@id, 'a')]", "predicate"),
+            ("//p[@id='a' and]", "predicate"),
+            ("//p[@id=a]", "predicate"),
+            ("//p[@id='a]", "unbalanced ' literal"),
+            ("//p[@id='a'']", "unbalanced '"),
+            ("//p[last()]", "predicate"),
+            ("(//p)[1]", "not supported"),
+        ],
+    )
+    def test_unsupported_predicates_fail_loudly(self, soup, xpath, reason):
+        with pytest.raises(ValueError, match="not supported") as error:
+            _select(soup, By.XPATH, xpath)
+        assert reason in str(error.value)
+
+    def test_other_locator_strategies(self, soup):
+        assert _texts(_select(soup, By.ID, "a")) == ["first"]
+        assert _texts(_select(soup, By.NAME, "token")) == [""]
+        assert _texts(_select(soup, By.CLASS_NAME, "footer")) == [
+            "Terms and Conditions"
+        ]
+        assert _texts(_select(soup, By.CSS_SELECTOR, "#menu a[href='/or']")) == [
+            "A or B"
+        ]
+        assert _texts(_select(soup, By.PARTIAL_LINK_TEXT, "Priv")) == ["Privacy"]
+
+
+class TestHttpDriver:
+    def test_page_reads_through_base_page(self, http_driver):
+        page = BasePage(http_driver)
+        assert page.get_title() == "Demo"
+        assert page.get_text(General.ELEMENTS) == "Elements"
+        assert page.get_text(General.FORMS) == "Forms"
+
+    def test_element_state(self, http_driver):
+        assert not http_driver.find_element(By.NAME, "token").is_displayed()
+        assert not http_driver.find_element(By.TAG_NAME, "button").is_enabled()
+        link = http_driver.find_element(By.LINK_TEXT, "Privacy")
+        assert link.get_attribute("href") == "/privacy"
+
+    def test_missing_element(self, http_driver):
+        with pytest.raises(NoSuchElementException):
+            http_driver.find_element(By.ID, "nope")
+
+    def test_interaction_needs_a_browser(self, http_driver):
+        with pytest.raises(ValueError, match="HTTP-only driver"):
+            http_driver.find_element(By.ID, "a").click()
+        with pytest.raises(ValueError, match="execute_script"):
+            http_driver.execute_script("return 1")
@@ -1,3 +1,9 @@
+import pytest
+
+from src.locators.locators import General
+from src.pageobjects.base_page import BasePage
+
+
 class TestMain(object):
     def test_main(self, make_driver):
         make_driver
@@ -18,3 +24,14 @@ class TestMain(object):
     #     """stores screenshot to job summary artifacts"""
     #     driver = make_driver
     #     assert driver.title == "Example sad as Domain"
+
+
+class TestMainHttp:
+    @pytest.mark.http_only
+    def test_main_title(self, make_driver):
+        assert BasePage(make_driver).get_title()
+
+    @pytest.mark.http_only
+    def test_main_sections(self, make_driver):
+        page = BasePage(make_driver)
+        assert page.get_text(General.ELEMENTS) == "Elements"
@@ -0,0 +1,120 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from core_driver import profile_template
+from core_driver.profile_template import ProfileTemplate
+
+
+class Warm:
+    """Fake warm-up run that leaves a cache file and the browser's locks."""
+
+    def __init__(self):
+        self.runs = 0
+
+    def __call__(self, user_data_dir: str):
+        self.runs += 1
+        root = Path(user_data_dir)
+        (root / "Default").mkdir()
+        (root / "Default" / "Cache").write_text(f"run {self.runs}")
+        (root / "SingletonLock").write_text("host-1234")
+        (root / "Default" / "lock").write_text("")
+
+
+def _age(path: Path, seconds: float) -> None:
+    past = time.time() - seconds
+    for entry in [path, *path.rglob("*")]:
+        os.utime(entry, (past, past))
+
+
+def _versions(template: ProfileTemplate):
+    return sorted(p.name for p in template.home.iterdir() if p.name.startswith("v-"))
+
+
+@pytest.fixture
+def template(tmp_path):
+    return ProfileTemplate("local", "dev", max_age=3600, root=tmp_path)
+
+
+class TestProfileTemplate:
+    def test_fresh_template_is_reused(self, template):
+        warm = Warm()
+        first = template.clone(warm=warm)
+        second = template.clone(warm=warm)
+
+        assert warm.runs == 1
+        assert first != second
+        assert len(_versions(template)) == 1
+        assert (Path(second) / "Default" / "Cache").read_text() == "run 1"
+
+    def test_stale_template_is_rebuilt_as_new_version(self, template):
+        warm = Warm()
+        template.clone(warm=warm)
+        old = template.path
+        _age(old, 2 * 3600)
+
+        clone = template.clone(warm=warm)
+        assert warm.runs == 2
+        assert template.path != old
+        assert _versions(template) == sorted([old.name, template.path.name])
+        assert (Path(clone) / "Default" / "Cache").read_text() == "run 2"
+
+    def test_old_versions_survive_the_grace_period(self, template):
+        warm = Warm()
+        template.ensure(warm)
+        old = template.path
+        _age(old, 3600 + profile_template._RETIRE_GRACE - 60)
+        template.ensure(warm)
+
+        template.cleanup_stale()
+        assert old.exists()
+
+        _age(old, 3600 + profile_template._RETIRE_GRACE + 60)
+        template.cleanup_stale()
+        assert not old.exists()
+        assert template.is_fresh()
+
+    def test_stale_session_clones_are_removed(self, template):
+        live = Path(template.clone(warm=Warm()))
+        crashed = Path(template.clone()).rename(template.sessions_dir / "crashed")
+        _age(crashed, 2 * 3600)
+
+        template.cleanup_stale()
+        assert live.exists()
+        assert not crashed.exists()
+
+    def test_lock_files_are_not_copied(self, template):
+        clone = Path(template.clone(warm=Warm()))
+
+        assert (clone / "Default" / "Cache").exists()
+        assert not (clone / "SingletonLock").exists()
+        assert not (clone / "Default" / "lock").exists()
+        # The template keeps them, only clones must start unlocked
+        assert (template.path / "SingletonLock").exists()
+
+    def test_copy_when_reflink_is_unsupported(self, template, monkeypatch):
+        calls = []
+
+        def no_reflink(src, dst):
+            calls.append(src)
+            return False
+
+        monkeypatch.setattr(profile_template, "_reflink", no_reflink)
+        clone = Path(template.clone(warm=Warm()))
+
+        assert (clone / "Default" / "Cache").read_text() == "run 1"
+        # Probed once, every later file is copied directly
+        assert len(calls) == 1
+        assert not template._reflink_supported
+
+    def test_clone_without_template(self, template):
+        with pytest.raises(FileNotFoundError):
+            template.clone()
+
+    def test_release(self, template):
+        clone = template.clone(warm=Warm())
+        ProfileTemplate.release(clone)
+        ProfileTemplate.release(None)
+        assert not Path(clone).exists()
@@ -0,0 +1,85 @@
+import time
+
+import pytest
+from selenium.common.exceptions import (
+    NoSuchElementException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+
+from utils import retry as retry_module
+from utils.helpers import retry
+from utils.retry import RetryAction, RetryPolicy, metrics, time_budget
+
+
+class Flaky:
+    """Raises the given errors in order, then returns 'ok'."""
+
+    def __init__(self, *errors):
+        self.__name__ = "flaky"
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def max_jitter(monkeypatch):
+    # Backoff always takes its full cap, delays become deterministic
+    monkeypatch.setattr(retry_module.random, "uniform", lambda low, high: high)
+
+
+class TestRetryPolicy:
+    @pytest.mark.parametrize(
+        "error, action",
+        [
+            (StaleElementReferenceException(), RetryAction.IMMEDIATE),
+            (TimeoutException(), RetryAction.FAIL),
+            (ConnectionError(), RetryAction.BACKOFF),
+            (AssertionError(), RetryAction.FAIL),
+            (NoSuchElementException(), RetryAction.FAIL),
+        ],
+    )
+    def test_classify(self, error, action):
+        assert RetryPolicy().classify(error) is action
+
+    def test_immediate_retry_recovers_and_is_counted(self):
+        flaky = Flaky(StaleElementReferenceException())
+        before = metrics.snapshot()
+
+        assert RetryPolicy(retries=2).call(flaky) == "ok"
+        assert flaky.calls == 2
+        assert metrics.since(before) == {"flaky:immediate": 1}
+
+    def test_helper_does_not_retry_real_failures(self):
+        flaky = Flaky(AssertionError("wrong title"))
+        with pytest.raises(AssertionError):
+            retry(retries=3, delay=0)(flaky)()
+        assert flaky.calls == 1
+
+    def test_helper_retries_errors_listed_by_the_call_site(self):
+        flaky = Flaky(AssertionError(), AssertionError())
+        assert retry(retries=3, delay=0, retry_on=(AssertionError,))(flaky)() == "ok"
+        assert flaky.calls == 3
+
+    def test_backoff_stops_at_the_test_budget(self, max_jitter):
+        flaky = Flaky(ConnectionError(), ConnectionError())
+        policy = RetryPolicy(retries=5, budget=None, base_delay=5, max_delay=5)
+
+        started = time.monotonic()
+        with time_budget(1), pytest.raises(ConnectionError):
+            policy.call(flaky)
+        assert flaky.calls == 1
+        assert time.monotonic() - started < 1
+
+    def test_backoff_sleeps_within_the_budget(self, max_jitter):
+        flaky = Flaky(ConnectionError())
+        policy = RetryPolicy(retries=1, budget=1, base_delay=0.05, max_delay=0.05)
+
+        started = time.monotonic()
+        assert policy.call(flaky) == "ok"
+        assert time.monotonic() - started >= 0.05
@@ -0,0 +1,138 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from utils.report_renderer import render
+from utils.stream_report import StreamingReporter, clear_run
+
+
+def _record(n: int, outcome: str = "passed") -> dict:
+    return {
+        "nodeid": f"tests/test_x.py::test_{n}",
+        "outcome": outcome,
+        "when": "call",
+        "duration": 0.01,
+        "worker": "gw0",
+        "artifacts": {},
+        "longrepr": None,
+    }
+
+
+def _append(path, *records, partial: str = "") -> None:
+    with open(path, "a", encoding="UTF-8") as fh:
+        for record in records:
+            fh.write(json.dumps(record) + "\n")
+        fh.write(partial)
+
+
+def _report(**overrides):
+    report = SimpleNamespace(
+        nodeid="tests/test_x.py::test_1",
+        when="call",
+        outcome="passed",
+        failed=False,
+        duration=0.5,
+        longrepr=None,
+        user_properties=[("screenshot", "reports/screenshots/x.png")],
+    )
+    for key, value in overrides.items():
+        setattr(report, key, value)
+    return report
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    stream, out = tmp_path / "stream", tmp_path / "html"
+    stream.mkdir()
+    return stream, out
+
+
+class TestReportRenderer:
+    def test_only_new_records_are_rendered(self, dirs):
+        stream, out = dirs
+        log_file = stream / "results-gw0.jsonl"
+        _append(log_file, _record(1), _record(2, "failed"))
+
+        assert render(stream, out) == 2
+        assert render(stream, out) == 0
+
+        _append(log_file, _record(3))
+        assert render(stream, out) == 1
+        index = (out / "index.html").read_text()
+        assert "passed: 2" in index and "failed: 1" in index
+
+    def test_partial_last_line_waits_for_the_next_render(self, dirs):
+        stream, out = dirs
+        log_file = stream / "results-gw0.jsonl"
+        line = json.dumps(_record(2))
+        _append(log_file, _record(1), partial=line[:20])
+
+        assert render(stream, out) == 1
+        _append(log_file, partial=line[20:] + "\n")
+        assert render(stream, out) == 1
+        assert "test_2" in (out / "page-0001.html").read_text()
+
+    def test_pages_roll_over_and_link_forward(self, dirs):
+        stream, out = dirs
+        _append(stream / "results-gw0.jsonl", *(_record(n) for n in range(3)))
+        render(stream, out, page_size=2)
+        assert "next" in (out / "page-0001.html").read_text()
+        assert "next" not in (out / "page-0002.html").read_text()
+
+        first_page = (out / "page-0001.html").stat().st_mtime_ns
+        _append(stream / "results-gw1.jsonl", *(_record(n) for n in range(3, 6)))
+        render(stream, out, page_size=2)
+
+        pages = sorted(p.name for p in out.glob("page-*.html"))
+        assert pages == ["page-0001.html", "page-0002.html", "page-0003.html"]
+        assert "next" in (out / "page-0002.html").read_text()
+        # Full pages before the one that grew are not rewritten
+        assert (out / "page-0001.html").stat().st_mtime_ns == first_page
+        assert (out / "page-0003.html").read_text().count("<tr><td") == 2
+
+    def test_cleared_run_starts_over(self, dirs):
+        stream, out = dirs
+        _append(stream / "results-gw0.jsonl", _record(1), _record(2))
+        render(stream, out)
+
+        clear_run(stream, out)
+        _append(stream / "results-gw0.jsonl", _record(3))
+        assert render(stream, out) == 1
+        assert "passed: 1" in (out / "index.html").read_text()
+
+
+class TestStreamingReporter:
+    @pytest.mark.parametrize(
+        "overrides, recorded",
+        [
+            ({}, True),
+            ({"when": "setup"}, False),
+            ({"when": "teardown"}, False),
+            ({"when": "setup", "outcome": "failed", "failed": True}, True),
+            ({"when": "setup", "outcome": "skipped"}, True),
+            # Forwarded from an xdist worker, already written by that worker
+            ({"node": object()}, False),
+        ],
+    )
+    def test_should_record(self, overrides, recorded):
+        assert StreamingReporter._should_record(_report(**overrides)) is recorded
+
+    def test_writes_one_line_per_result(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("PYTEST_XDIST_WORKER", "gw3")
+        reporter = StreamingReporter(str(tmp_path))
+        reporter.pytest_runtest_logreport(_report())
+        reporter.pytest_runtest_logreport(_report(when="setup"))
+        reporter.pytest_runtest_logreport(
+            _report(outcome="failed", failed=True, longrepr="AssertionError")
+        )
+        reporter.pytest_sessionfinish()
+
+        lines = (tmp_path / "results-gw3.jsonl").read_text().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert [r["outcome"] for r in records] == ["passed", "failed"]
+        assert records[0]["artifacts"] == {
+            "screenshot": "reports/screenshots/x.png"
+        }
+        assert records[1]["longrepr"] == "AssertionError"
+        assert {r["worker"] for r in records} == {"gw3"}
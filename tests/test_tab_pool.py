@@ -0,0 +1,138 @@
+import pytest
+from selenium.common.exceptions import JavascriptException
+from urllib3.exceptions import MaxRetryError
+
+from core_driver.tab_pool import TabDriver, TabPool
+
+
+class FakeBrowser:
+    """In-memory WebDriver with windows, cookies and storage, no CDP."""
+
+    def __init__(self):
+        self.session_id = "s1"
+        self.windows = {"home": None}
+        self.handle = "home"
+        self.cookies = {}
+        self.storage = {}
+        self.calls = []
+        self.switch_to = self
+        self.fail_close = None
+
+    @property
+    def current_window_handle(self):
+        return self.handle
+
+    @property
+    def window_handles(self):
+        return list(self.windows)
+
+    @property
+    def title(self):
+        return f"title of {self.windows[self.handle]}"
+
+    def window(self, handle):
+        self.calls.append(("switch", handle))
+        self.handle = handle
+
+    def new_window(self, kind):
+        self.handle = f"tab{len(self.windows)}"
+        self.windows[self.handle] = None
+
+    def get(self, url):
+        self.windows[self.handle] = url
+        self.cookies[url] = "session=1"
+        self.storage[url] = "token"
+
+    def execute_script(self, script, *args):
+        url = self.windows[self.handle]
+        if url is None:
+            raise JavascriptException("SecurityError: no storage on about:blank")
+        self.storage.pop(url, None)
+
+    def delete_all_cookies(self):
+        self.cookies.pop(self.windows[self.handle], None)
+
+    def close(self):
+        if self.fail_close is not None:
+            raise self.fail_close
+        self.calls.append(("close", self.handle))
+        del self.windows[self.handle]
+
+    def quit(self):
+        self.calls.append(("quit", None))
+
+
+@pytest.fixture
+def browsers():
+    return []
+
+
+@pytest.fixture
+def pool(browsers):
+    def create():
+        browsers.append(FakeBrowser())
+        return browsers[-1]
+
+    pool = TabPool(create)
+    yield pool
+    pool.quit()
+
+
+class TestTabPool:
+    def test_tabs_share_one_session(self, pool, browsers):
+        first = pool.open("http://site/a")
+        first.quit()
+        second = pool.open("http://site/b")
+
+        assert len(browsers) == 1
+        assert second.title == "title of http://site/b"
+        assert list(browsers[0].windows) == ["home", "tab1"]
+
+    def test_calls_are_routed_to_the_tab(self, pool, browsers):
+        first = pool.open("http://site/a")
+        second = pool.open("http://site/b")
+
+        assert first.title == "title of http://site/a"
+        assert second.title == "title of http://site/b"
+        # Switching only happens when the active window changes
+        assert second.title == "title of http://site/b"
+        assert browsers[0].calls == [("switch", "tab1"), ("switch", "tab2")]
+
+    def test_missing_attributes_are_not_forwarded(self, pool):
+        tab = pool.open("http://site/a")
+        assert not hasattr(tab, "get_full_page_screenshot_as_png")
+        assert isinstance(tab, TabDriver)
+
+    def test_shared_tab_clears_its_origin_on_close(self, pool, browsers):
+        pool.open("http://site/a").quit()
+
+        assert browsers[0].cookies == {}
+        assert browsers[0].storage == {}
+        assert browsers[0].handle == "home"
+
+    def test_blank_tab_still_closes(self, pool, browsers):
+        tab = pool.open("http://site/a")
+        browsers[0].windows[tab.window_handle] = None
+        tab.quit()
+        assert ("close", "tab1") in browsers[0].calls
+
+    def test_dead_session_drops_the_tab(self, pool, browsers, monkeypatch):
+        tab = pool.open("http://site/a")
+        monkeypatch.setattr(pool.health, "is_alive", lambda: False)
+        browsers[0].fail_close = MaxRetryError(None, "/session/s1/window")
+
+        tab.quit()
+        assert pool.tabs == {}
+        assert ("close", "tab1") not in browsers[0].calls
+
+        # The next test gets a new browser, the dead one is killed, not quit
+        pool.open("http://site/b")
+        assert len(browsers) == 2
+        assert ("quit", None) not in browsers[0].calls
+
+    def test_transport_errors_on_close_are_logged(self, pool, browsers):
+        tab = pool.open("http://site/a")
+        browsers[0].fail_close = MaxRetryError(None, "/session/s1/window")
+
+        tab.quit()
+        assert pool.tabs == {}
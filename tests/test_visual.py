@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from utils.visual import BaselineStore, VisualComparator, decode_png, encode_png
+
+
+@pytest.fixture
+def page():
+    rng = np.random.default_rng(7)
+    return rng.integers(0, 256, size=(100, 130, 3), dtype=np.uint8)
+
+
+class TestVisualComparator:
+    def test_identical_images_have_no_diff(self, page):
+        diff = VisualComparator().compare(page, page.copy())
+        assert diff.changed_ratio == 0.0
+        assert diff.changed_tiles == 0
+        assert diff.changed_mask is None
+
+    def test_noise_within_tolerance_is_ignored(self, page):
+        actual = page.copy()
+        actual[::2] = np.clip(actual[::2].astype(np.int16) + 5, 0, 255)
+        diff = VisualComparator(pixel_tolerance=16).compare(page, actual)
+        assert diff.changed_ratio == 0.0
+
+    def test_change_with_same_mean_colour_is_detected(self):
+        # Both tiles have the same average colour and luminance layout
+        baseline = np.full((32, 32, 3), 128, dtype=np.uint8)
+        actual = baseline.copy()
+        actual[0, 0] = 255
+        actual[0, 1] = 1
+
+        diff = VisualComparator().compare(baseline, actual)
+        assert diff.changed_tiles == 1
+        assert diff.changed_mask.sum() == 2
+        assert diff.changed_ratio == pytest.approx(2 / 32**2)
+
+    def test_bright_pixels_do_not_overflow(self):
+        baseline = np.full((32, 32, 3), 250, dtype=np.uint8)
+        actual = baseline.copy()
+        actual[5:10, 5:10] = 10
+        assert VisualComparator().compare(baseline, actual).changed_mask.sum() == 25
+
+    def test_changes_in_padded_edge_tiles(self, page):
+        actual = page.copy()
+        actual[-1, -1] = 255 - actual[-1, -1]
+
+        diff = VisualComparator().compare(page, actual)
+        assert diff.changed_mask.shape == page.shape[:2]
+        assert diff.changed_mask[-1, -1]
+        assert diff.changed_mask.sum() == 1
+
+    def test_masked_regions_are_ignored(self, page):
+        actual = page.copy()
+        actual[10:20, 40:60] = 0
+        diff = VisualComparator().compare(page, actual, masks=[(40, 10, 20, 10)])
+        assert diff.changed_ratio == 0.0
+
+    def test_overlapping_masks_count_once(self):
+        baseline = np.zeros((100, 100, 3), dtype=np.uint8)
+        actual = baseline.copy()
+        actual[:10, :10] = 255
+
+        diff = VisualComparator().compare(
+            baseline, actual, masks=[(50, 50, 50, 50)] * 4 + [(60, 60, 10, 10)]
+        )
+        assert diff.changed_ratio == pytest.approx(100 / (100**2 - 50**2))
+
+    def test_masks_are_clipped_to_the_image(self):
+        baseline = np.zeros((100, 100, 3), dtype=np.uint8)
+        actual = baseline.copy()
+        actual[:10, :10] = 255
+        actual[90:, 90:] = 255
+
+        diff = VisualComparator().compare(
+            baseline, actual, masks=[(50, 50, 200, 200), (-20, -20, 10, 10)]
+        )
+        assert diff.changed_ratio == pytest.approx(100 / (100**2 - 50**2))
+        assert diff.changed_mask[:10, :10].all()
+        assert not diff.changed_mask[50:].any()
+
+    def test_size_change_is_a_full_diff(self, page):
+        diff = VisualComparator().compare(page, page[:50])
+        assert diff.changed_ratio == 1.0
+        assert "Size changed from 130x100 to 130x50" == diff.message
+
+    def test_tile_must_be_word_aligned(self):
+        with pytest.raises(ValueError):
+            VisualComparator(tile=12)
+
+
+class TestBaselineStore:
+    def test_missing_checkpoint(self, tmp_path):
+        assert BaselineStore(tmp_path).get("home") is None
+
+    def test_round_trip_through_png(self, tmp_path, page):
+        store = BaselineStore(tmp_path)
+        store.put("home", encode_png(page))
+        np.testing.assert_array_equal(decode_png(store.get("home")), page)
+
+    def test_identical_images_share_one_object(self, tmp_path, page):
+        store = BaselineStore(tmp_path)
+        png = encode_png(page)
+        digest = store.put("home", png)
+
+        assert store.put("home-mobile", png) == digest
+        assert len(list((tmp_path / "objects").rglob("*.png"))) == 1
+        assert (tmp_path / "refs" / "home-mobile").read_text() == digest
+
+    def test_put_moves_the_ref(self, tmp_path, page):
+        store = BaselineStore(tmp_path)
+        store.put("home", encode_png(page))
+        updated = encode_png(255 - page)
+        store.put("home", updated)
+
+        assert store.get("home") == updated
+        assert not list(tmp_path.rglob(".tmp-*"))
@@ -2,13 +2,7 @@ import argparse
 import os
 import sys
 from pathlib import Path
-from typing import Optional
-
-from colorama import init
-from pyfiglet import Figlet
-import inquirer
-
-from utils.scraper.chrome_scraper import ChromePageScraper
+from typing import List, Optional
 
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
@@ -23,7 +17,7 @@ TASKS = {
 }
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     """Parse command line arguments."""
     parser = argparse.ArgumentParser(description="Driver Management Tool")
 
@@ -46,11 +40,38 @@ def parse_args() -> argparse.Namespace:
         help="Specify the milestone version (e.g., '131').",
     )
 
-    return parser.parse_args()
+    # Non-interactive batch download into the content-addressed store
+    sync_parser = subparsers.add_parser(
+        'sync', help='Download several ChromeDriver milestones into resources/store'
+    )
+    sync_parser.add_argument(
+        "--milestones",
+        type=lambda value: [m.strip() for m in value.split(",") if m.strip()],
+        required=True,
+        help="Comma separated milestones (e.g., '129,130,131').",
+    )
+    sync_parser.add_argument(
+        "--mirror",
+        default=os.environ.get("PSAF_MIRROR"),
+        help="Base URL of a Chrome for Testing manifest, $PSAF_MIRROR by default.",
+    )
+    sync_parser.add_argument(
+        "--platform", default=None, help="Target platform (e.g., 'linux64')."
+    )
+    sync_parser.add_argument(
+        "--store", default=None, help="Store directory, resources/store by default."
+    )
+    sync_parser.add_argument(
+        "--jobs", type=int, default=4, help="Parallel downloads."
+    )
+
+    return parser.parse_args(argv)
 
 
 def execute_task(task: str, milestone: str, version: Optional[str]) -> None:
     """Execute the selected task."""
+    from utils.scraper.chrome_scraper import ChromePageScraper
+
     try:
         match task:
             case "get_driver_by_milestone":
@@ -66,14 +87,44 @@ def execute_task(task: str, milestone: str, version: Optional[str]) -> None:
         print(f"Error executing task '{task}': {e}")
 
 
-def main() -> None:
+def sync(args: argparse.Namespace) -> int:
+    """Download the requested milestones without prompting, return exit code."""
+    from http.client import HTTPException
+
+    from utils.driver_store import DEFAULT_MIRROR, DriverStore
+
+    store = DriverStore(root=args.store, mirror=args.mirror or DEFAULT_MIRROR)
+    try:
+        results = store.sync(
+            args.milestones, platform_name=args.platform, jobs=args.jobs
+        )
+    except (OSError, HTTPException, ValueError, KeyError) as e:
+        # Unreachable mirror, unknown milestone or a malformed manifest
+        print(f"sync failed: {e}")
+        return 1
+    for result in results:
+        if result.error:
+            print(f"{result.milestone}: failed, {result.error}")
+        else:
+            print(f"{result.milestone}: {result.version} -> {result.path}")
+    return 1 if any(result.error for result in results) else 0
+
+
+def main(argv: Optional[List[str]] = None) -> None:
     """Entry point for the Driver Management CLI."""
+    args = parse_args(argv)
+    if args.driver == "sync":
+        sys.exit(sync(args))
+
+    # Imported here, the batch mode above starts without them
+    from colorama import init
+    from pyfiglet import Figlet
+    import inquirer
+
     init()
     f = Figlet(font="Slant")
     print(f.renderText("Driver Tool"))
 
-    args = parse_args()
-
     # Show version or documentation if requested
     if args.version:
         print(f"Driver Tool version: {__version__}")
@@ -0,0 +1,206 @@
+import csv
+from pathlib import Path
+from typing import Any, Dict, Iterator, NamedTuple, Optional, Sequence, Tuple
+
+import pytest
+import yaml
+
+Row = Dict[str, Any]
+
+_CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+
+
+class RowRef(NamedTuple):
+    """
+    Lightweight handle of one data row, this is what pytest parametrizes.
+    offset is the byte offset of a CSV record, None for sources read forward.
+    """
+
+    source: str
+    index: int
+    offset: Optional[int]
+    id: str
+
+
+def data_driven(source: str, id_keys: Sequence[str] = ()):
+    """
+    Parametrize a test with the rows of a YAML, CSV or XLSX file.
+
+    Rows reach the test through the data_row fixture. Collection only keeps a
+    RowRef per row, the row itself is read when the test runs, so every xdist
+    worker loads just the rows of the tests it executes.
+
+    :param source (str): File name, relative paths resolve against config/.
+    :param id_keys (Sequence[str]): Row keys joined into the test id.
+    """
+    return pytest.mark.data_driven(source=source, id_keys=tuple(id_keys))
+
+
+def _resolve(source: str) -> Path:
+    path = Path(source)
+    if not path.is_absolute():
+        path = _CONFIG_DIR / path
+    if not path.exists():
+        raise FileNotFoundError(f"The file {path} does not exist.")
+    return path
+
+
+def _iter_yaml(path: Path) -> Iterator[Tuple[Optional[int], Row]]:
+    """Yield items of top-level sequences and single documents one at a time."""
+    with open(path, "r", encoding="UTF-8") as stream:
+        loader = yaml.SafeLoader(stream)
+        try:
+            loader.get_event()  # StreamStart
+            while not loader.check_event(yaml.StreamEndEvent):
+                loader.get_event()  # DocumentStart
+                if loader.check_event(yaml.SequenceStartEvent):
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        node = loader.compose_node(None, None)
+                        yield None, loader.construct_document(node)
+                    loader.get_event()
+                elif not loader.check_event(yaml.DocumentEndEvent):
+                    node = loader.compose_node(None, None)
+                    yield None, loader.construct_document(node)
+                loader.get_event()  # DocumentEnd
+        finally:
+            loader.dispose()
+
+
+def _iter_csv(path: Path) -> Iterator[Tuple[Optional[int], Row]]:
+    """Yield rows with the file offset they start at, for O(1) lookups later."""
+    with open(path, "r", encoding="UTF-8", newline="") as stream:
+        header = next(csv.reader([stream.readline()]))
+        starts = []
+
+        def lines():
+            while True:
+                starts.append(stream.tell())
+                line = stream.readline()
+                if not line:
+                    return
+                yield line
+
+        for values in csv.reader(lines()):
+            # The record began at the first line the reader pulled for it
+            offset = starts[0]
+            starts.clear()
+            if values:
+                yield offset, dict(zip(header, values))
+
+
+def _iter_xlsx(path: Path) -> Iterator[Tuple[Optional[int], Row]]:
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        header = next(sheet.iter_rows(max_row=1, values_only=True))
+        for values in sheet.iter_rows(min_row=2, values_only=True):
+            if any(value is not None for value in values):
+                yield None, dict(zip(header, values))
+    finally:
+        workbook.close()
+
+
+_READERS = {
+    ".yaml": _iter_yaml,
+    ".yml": _iter_yaml,
+    ".csv": _iter_csv,
+    ".xlsx": _iter_xlsx,
+}
+
+
+def iter_rows(source: str) -> Iterator[Tuple[Optional[int], Row]]:
+    path = _resolve(source)
+    reader = _READERS.get(path.suffix.lower())
+    if reader is None:
+        raise ValueError(f"Unsupported data source: {path.name}")
+    return reader(path)
+
+
+def _row_id(row: Row, index: int, id_keys: Sequence[str]) -> str:
+    if not id_keys or not isinstance(row, dict):
+        return f"row{index}"
+    return "-".join(str(row.get(key)) for key in id_keys)
+
+
+def iter_refs(source: str, id_keys: Sequence[str] = ()) -> Iterator[RowRef]:
+    """Stream a source once, keeping only ids and offsets of its rows."""
+    for index, (offset, row) in enumerate(iter_rows(source)):
+        yield RowRef(source, index, offset, _row_id(row, index, id_keys))
+
+
+class _Cursor:
+    """
+    Forward-only position in a source, reused while tests run in order.
+
+    One row is read ahead, so the file is closed as soon as the last row was
+    handed out instead of staying open for the rest of the session.
+    """
+
+    def __init__(self, source: str):
+        self.source = source
+        self.rows = iter_rows(source)
+        self.position = 0
+        self._ahead = next(self.rows, None)
+
+    @property
+    def exhausted(self) -> bool:
+        return self._ahead is None
+
+    def _advance(self) -> None:
+        self._ahead = next(self.rows, None)
+        self.position += 1
+        if self._ahead is None:
+            self.close()
+
+    def seek(self, index: int) -> Row:
+        if index < self.position:
+            raise IndexError(index)
+        while self.position < index and not self.exhausted:
+            self._advance()
+        if self.exhausted:
+            raise IndexError(index)
+        row = self._ahead[1]
+        self._advance()
+        return row
+
+    def close(self) -> None:
+        self.rows.close()
+
+
+_cursors: Dict[str, _Cursor] = {}
+
+
+def load_row(ref: RowRef) -> Row:
+    """Read the single row a RowRef points at."""
+    path = _resolve(ref.source)
+    if path.suffix.lower() == ".csv":
+        with open(path, "r", encoding="UTF-8", newline="") as stream:
+            header = next(csv.reader([stream.readline()]))
+            stream.seek(ref.offset)
+            return dict(zip(header, next(csv.reader(stream))))
+
+    # XLSX is zipped XML and YAML has no stable offsets, both read forward
+    cursor = _cursors.get(ref.source)
+    if cursor is None or ref.index < cursor.position:
+        if cursor is not None:
+            cursor.close()
+        cursor = _cursors[ref.source] = _Cursor(ref.source)
+    try:
+        return cursor.seek(ref.index)
+    finally:
+        if cursor.exhausted:
+            del _cursors[ref.source]
+
+
+def parametrize_data_driven(metafunc) -> None:
+    """Turn a data_driven mark into an indirect data_row parametrization."""
+    marker = metafunc.definition.get_closest_marker("data_driven")
+    if marker is None or "data_row" not in metafunc.fixturenames:
+        return
+    refs = list(iter_refs(marker.kwargs["source"], marker.kwargs["id_keys"]))
+    metafunc.parametrize(
+        "data_row", refs, ids=[ref.id for ref in refs], indirect=True
+    )
@@ -0,0 +1,284 @@
+import hashlib
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPException
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin
+from urllib.request import Request, urlopen
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+DEFAULT_MIRROR = "https://googlechromelabs.github.io/chrome-for-testing"
+MANIFEST = "latest-versions-per-milestone-with-downloads.json"
+
+_PROJECT_DIR = Path(__file__).resolve().parent.parent
+_CHUNK = 1024 * 1024
+
+
+def current_platform() -> str:
+    """Chrome for Testing platform name of this machine."""
+    machine = platform.machine().lower()
+    if sys.platform == "darwin":
+        return "mac-arm64" if machine in ("arm64", "aarch64") else "mac-x64"
+    if sys.platform == "win32":
+        return "win64" if machine.endswith("64") else "win32"
+    return "linux64"
+
+
+class Download(NamedTuple):
+    milestone: str
+    version: str
+    platform: str
+    url: str
+    sha256: Optional[str]
+
+
+class SyncResult(NamedTuple):
+    milestone: str
+    version: str
+    sha256: Optional[str]
+    path: Optional[Path]
+    error: Optional[str] = None
+
+
+def _fetch(url: str, timeout: float, headers: Optional[Dict] = None):
+    return urlopen(Request(url, headers=headers or {}), timeout=timeout)
+
+
+def _write_atomic(path: Path, data: bytes, mode: Optional[int] = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    if mode is not None:
+        os.chmod(tmp, mode)
+    os.replace(tmp, path)
+
+
+class DriverStore:
+    """
+    Content-addressed store of driver binaries synced from a mirror.
+
+    The mirror serves a Chrome for Testing manifest
+    (latest-versions-per-milestone-with-downloads.json); download URLs in it
+    may be relative to the mirror. Archives are fetched in parallel in
+    chunks and resumed from their .part file after an interruption. The
+    extracted binary is stored once under objects/<sha256[:2]>/<sha256> and
+    index.json maps each milestone to it.
+
+    Checksums come from a "sha256" key of the manifest entry or a <url>.sha256
+    file next to the archive. Without either the archive CRCs are checked and
+    the digest is pinned in the index, later syncs of the same version must
+    reproduce it.
+
+    :param root (Optional[Path]): Store directory, resources/store by default.
+    :param mirror (str): Base URL of the manifest.
+    :param timeout (float): Socket timeout of every request in seconds.
+    :param retries (int): Resume attempts per archive after a network error.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        mirror: str = DEFAULT_MIRROR,
+        timeout: float = 30,
+        retries: int = 3,
+    ):
+        self.root = Path(root) if root else _PROJECT_DIR / "resources" / "store"
+        self.mirror = mirror.rstrip("/") + "/"
+        self.timeout = timeout
+        self.retries = retries
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    def load_index(self) -> Dict:
+        if self.index_path.exists():
+            return json.loads(self.index_path.read_text())
+        return {"chromedriver": {}}
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    def driver_path(self, milestone: str) -> Optional[Path]:
+        """Stored chromedriver of a milestone, None if it was never synced."""
+        entry = self.load_index()["chromedriver"].get(str(milestone))
+        if entry is None:
+            return None
+        path = self.object_path(entry["sha256"])
+        return path if path.exists() else None
+
+    def resolve(
+        self, milestones: Iterable[str], platform_name: str
+    ) -> List[Download]:
+        manifest_url = urljoin(self.mirror, MANIFEST)
+        with _fetch(manifest_url, self.timeout) as response:
+            manifest = json.load(response)
+
+        downloads = []
+        for milestone in milestones:
+            entry = manifest["milestones"].get(str(milestone))
+            if entry is None:
+                raise ValueError(f"Milestone {milestone} is not in {manifest_url}")
+            for item in entry["downloads"].get("chromedriver", []):
+                if item["platform"] == platform_name:
+                    downloads.append(
+                        Download(
+                            str(milestone),
+                            entry["version"],
+                            platform_name,
+                            urljoin(manifest_url, item["url"]),
+                            item.get("sha256"),
+                        )
+                    )
+                    break
+            else:
+                raise ValueError(
+                    f"No chromedriver for {platform_name} in milestone {milestone}"
+                )
+        return downloads
+
+    def _published_sha256(self, download: Download) -> Optional[str]:
+        if download.sha256:
+            return download.sha256.lower()
+        try:
+            with _fetch(download.url + ".sha256", self.timeout) as response:
+                return response.read().decode().split()[0].lower()
+        except (HTTPError, URLError, IndexError):
+            return None
+
+    def _download(self, download: Download) -> Path:
+        """Fetch an archive into parts/, resuming a partial file."""
+        name = f"chromedriver-{download.version}-{download.platform}.zip"
+        part = self.root / "parts" / f"{name}.part"
+        part.parent.mkdir(parents=True, exist_ok=True)
+
+        for attempt in range(self.retries + 1):
+            offset = part.stat().st_size if part.exists() else 0
+            headers = {"Range": f"bytes={offset}-"} if offset else {}
+            try:
+                with _fetch(download.url, self.timeout, headers) as response:
+                    # A server ignoring Range answers 200 with the whole file
+                    mode = "ab" if offset and response.status == 206 else "wb"
+                    with open(part, mode) as fh:
+                        while chunk := response.read(_CHUNK):
+                            fh.write(chunk)
+                return part
+            except HTTPError as e:
+                if e.code != 416:
+                    raise
+                total = e.headers.get("Content-Range", "").rpartition("/")[2]
+                if not total.isdigit() or int(total) == offset:
+                    # Range starts at the end, the previous attempt finished
+                    return part
+                # Longer than the archive, never resumable
+                log.warning(f"Discarding {part.name}, larger than the archive")
+                part.unlink()
+                if attempt == self.retries:
+                    raise
+            except (URLError, OSError, HTTPException) as e:
+                if attempt == self.retries:
+                    raise
+                log.warning(f"Download of {name} interrupted, resuming: {e}")
+                time.sleep(min(2**attempt, 10))
+        return part
+
+    @staticmethod
+    def _sha256_file(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as fh:
+            while chunk := fh.read(_CHUNK):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _extract_driver(archive: Path) -> bytes:
+        with zipfile.ZipFile(archive) as zf:
+            bad = zf.testzip()
+            if bad is not None:
+                raise ValueError(f"Corrupt member {bad} in {archive.name}")
+            for member in zf.namelist():
+                if Path(member).name in ("chromedriver", "chromedriver.exe"):
+                    return zf.read(member)
+        raise ValueError(f"No chromedriver binary in {archive.name}")
+
+    def fetch(self, download: Download, pinned: Optional[Dict] = None) -> Dict:
+        """Download, verify and store one driver, return its index entry."""
+        if pinned and pinned.get("version") == download.version:
+            if self.object_path(pinned["sha256"]).exists():
+                return pinned
+
+        archive = self._download(download)
+        archive_sha256 = self._sha256_file(archive)
+        expected = self._published_sha256(download)
+        if expected is None and pinned and pinned.get("version") == download.version:
+            expected = pinned.get("archive_sha256")
+        if expected is not None and archive_sha256 != expected:
+            archive.unlink()
+            raise ValueError(
+                f"Checksum mismatch for {download.url}: "
+                f"expected {expected}, got {archive_sha256}"
+            )
+
+        try:
+            binary = self._extract_driver(archive)
+        except (zipfile.BadZipFile, ValueError):
+            # Resuming a corrupt part would fail the same way on every sync
+            archive.unlink()
+            raise
+        digest = hashlib.sha256(binary).hexdigest()
+        if not self.object_path(digest).exists():
+            _write_atomic(self.object_path(digest), binary, mode=0o755)
+        archive.unlink()
+        log.info(f"Stored chromedriver {download.version} as {digest[:12]}")
+        return {
+            "version": download.version,
+            "platform": download.platform,
+            "url": download.url,
+            "archive_sha256": archive_sha256,
+            "sha256": digest,
+        }
+
+    def sync(
+        self,
+        milestones: Iterable[str],
+        platform_name: Optional[str] = None,
+        jobs: int = 4,
+    ) -> List[SyncResult]:
+        """Sync several milestones concurrently and update the index once."""
+        downloads = self.resolve(milestones, platform_name or current_platform())
+        index = self.load_index()
+        stored = index.setdefault("chromedriver", {})
+
+        def _fetch_one(download: Download) -> SyncResult:
+            try:
+                entry = self.fetch(download, stored.get(download.milestone))
+            except Exception as e:
+                log.error(f"Sync of chromedriver {download.milestone} failed: {e}")
+                return SyncResult(
+                    download.milestone, download.version, None, None, str(e)
+                )
+            stored[download.milestone] = entry
+            return SyncResult(
+                download.milestone,
+                download.version,
+                entry["sha256"],
+                self.object_path(entry["sha256"]),
+            )
+
+        with ThreadPoolExecutor(max_workers=max(jobs, 1)) as pool:
+            results = list(pool.map(_fetch_one, downloads))
+
+        _write_atomic(self.index_path, json.dumps(index, indent=2).encode())
+        return results
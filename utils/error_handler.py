@@ -7,6 +7,8 @@ class ErrorType(Enum):
     UNSUPPORTED_DRIVER_TYPE = 3
     DRIVER_NOT_FOUND = 4
     CAPABILITY_NOT_FOUND = 5
+    BROWSER_REQUIRED = 6
+    UNSUPPORTED_LOCATOR = 7
 
 
 class ErrorHandler:
@@ -15,7 +17,11 @@ class ErrorHandler:
         ErrorType.EMPTY_URL_ERROR: "Environment variable is empty or not found",
         ErrorType.UNSUPPORTED_DRIVER_TYPE: "Unsupported driver type",
         ErrorType.DRIVER_NOT_FOUND: "WebDriver binary not found at ",
-        ErrorType.CAPABILITY_NOT_FOUND: "Capabilities file not found"
+        ErrorType.CAPABILITY_NOT_FOUND: "Capabilities file not found",
+        ErrorType.BROWSER_REQUIRED: "HTTP-only driver cannot run JavaScript or "
+        "interact with the page, remove the http_only marker to use a browser:",
+        ErrorType.UNSUPPORTED_LOCATOR: "Locator is not supported by the HTTP-only "
+        "driver:",
     }
 
     @staticmethod
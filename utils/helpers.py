@@ -1,24 +1,21 @@
 import time
 from functools import wraps
 
+from utils.retry import DEFAULT_RULES, RetryAction, RetryPolicy
 
-def retry(retries=3, delay=2):
-    def decorator(func):
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            attempts = 0
-            while attempts < retries:
-                try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    attempts += 1
-                    print(f"Attempt {attempts} failed: {e}")
-                    time.sleep(delay)
-            return func(*args, **kwargs)
-
-        return wrapper
-
-    return decorator
+
+def retry(retries=3, delay=2, budget=None, retry_on=()):
+    """
+    Retry a function on failure.
+
+    Stale and intercepted elements are retried at once and connection errors
+    back off with jitter starting from delay seconds. Anything else, such as
+    an AssertionError, fails at once unless the call site lists it in retry_on.
+    """
+    rules = DEFAULT_RULES
+    if retry_on:
+        rules = ((tuple(retry_on), RetryAction.BACKOFF),) + DEFAULT_RULES
+    return RetryPolicy(retries=retries, budget=budget, base_delay=delay, rules=rules)
 
 
 def timing(func):
@@ -0,0 +1,172 @@
+"""
+Incremental HTML renderer for the JSONL logs of StreamingReporter.
+
+Usage:
+    python -m utils.report_renderer reports/stream reports/html --page-size 500
+
+Only records appended since the previous run are read. They are added to the
+last, not yet full page; earlier pages are only rewritten once, to link the
+page that follows them.
+"""
+import argparse
+import html
+import json
+import os
+from pathlib import Path
+from typing import Dict
+
+_STATE = ".render-state.json"
+
+_PAGE = """<!DOCTYPE html>
+<html lang="en">
+<head><meta charset="utf-8"><title>{title}</title>
+<style>
+body {{ font-family: sans-serif; margin: 2em; }}
+table {{ border-collapse: collapse; width: 100%; }}
+td, th {{ border: 1px solid #ddd; padding: 4px 8px; text-align: left; }}
+.passed {{ color: #2a7d2a; }} .failed, .error {{ color: #b22; }}
+.skipped {{ color: #888; }} pre {{ white-space: pre-wrap; margin: 0; }}
+</style></head>
+<body>
+<h1>{title}</h1>
+<p>{navigation}</p>
+{body}
+</body>
+</html>
+"""
+
+
+def _load_state(out_dir: Path) -> Dict:
+    state_file = out_dir / _STATE
+    if state_file.exists():
+        return json.loads(state_file.read_text())
+    return {"offsets": {}, "pages": 0, "page_rows": 0, "totals": {}}
+
+
+def _read_new_records(stream_dir: Path, offsets: Dict[str, int]):
+    for log_file in sorted(stream_dir.glob("*.jsonl")):
+        with open(log_file, "rb") as fh:
+            fh.seek(offsets.get(log_file.name, 0))
+            for line in fh:
+                if not line.endswith(b"\n"):
+                    # Still being written, picked up by the next run
+                    break
+                offsets[log_file.name] = fh.tell()
+                yield json.loads(line)
+
+
+def _row(record: Dict, out_dir: Path) -> str:
+    outcome = html.escape(record["outcome"])
+    if record["when"] != "call" and record["outcome"] == "failed":
+        outcome = "error"
+    links = " ".join(
+        f'<a href="{html.escape(os.path.relpath(path, out_dir))}">'
+        f"{html.escape(name)}</a>"
+        for name, path in record.get("artifacts", {}).items()
+    )
+    details = ""
+    if record.get("longrepr"):
+        details = (
+            "<details><summary>traceback</summary>"
+            f"<pre>{html.escape(record['longrepr'])}</pre></details>"
+        )
+    return (
+        f'<tr><td class="{outcome}">{outcome}</td>'
+        f"<td>{html.escape(record['nodeid'])}{details}</td>"
+        f"<td>{record['duration']:.2f}s</td>"
+        f"<td>{html.escape(record['worker'])}</td><td>{links}</td></tr>\n"
+    )
+
+
+def _page_name(number: int) -> str:
+    return f"page-{number:04d}.html"
+
+
+def _write_page(out_dir: Path, number: int, pages: int) -> None:
+    rows = (out_dir / f"page-{number:04d}.rows").read_text(encoding="UTF-8")
+    links = ['<a href="index.html">summary</a>']
+    if number > 1:
+        links.append(f'<a href="{_page_name(number - 1)}">previous</a>')
+    if number < pages:
+        links.append(f'<a href="{_page_name(number + 1)}">next</a>')
+    body = (
+        "<table><tr><th>Outcome</th><th>Test</th><th>Duration</th>"
+        f"<th>Worker</th><th>Artifacts</th></tr>\n{rows}</table>"
+    )
+    (out_dir / _page_name(number)).write_text(
+        _PAGE.format(
+            title=f"Results page {number}", navigation=" | ".join(links), body=body
+        ),
+        encoding="UTF-8",
+    )
+
+
+def _write_index(out_dir: Path, state: Dict) -> None:
+    totals = "".join(
+        f'<li class="{html.escape(k)}">{html.escape(k)}: {v}</li>'
+        for k, v in sorted(state["totals"].items())
+    )
+    pages = " ".join(
+        f'<a href="{_page_name(n)}">{n}</a>' for n in range(1, state["pages"] + 1)
+    )
+    (out_dir / "index.html").write_text(
+        _PAGE.format(
+            title="Test results",
+            navigation=f"Pages: {pages}",
+            body=f"<ul>{totals}</ul>",
+        ),
+        encoding="UTF-8",
+    )
+
+
+def render(stream_dir, out_dir, page_size: int = 500) -> int:
+    """Render records added since the last call, return how many were added."""
+    stream_dir, out_dir = Path(stream_dir), Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    state = _load_state(out_dir)
+
+    touched, added = set(), 0
+    pages_before = state["pages"]
+    rows_file = None
+    for record in _read_new_records(stream_dir, state["offsets"]):
+        if state["pages"] == 0 or state["page_rows"] >= page_size:
+            if rows_file:
+                rows_file.close()
+            state["pages"] += 1
+            state["page_rows"] = 0
+            rows_file = None
+        if rows_file is None:
+            rows_path = out_dir / f"page-{state['pages']:04d}.rows"
+            rows_file = open(rows_path, "a", encoding="UTF-8")
+            touched.add(state["pages"])
+        rows_file.write(_row(record, out_dir))
+        state["page_rows"] += 1
+        outcome = record["outcome"]
+        state["totals"][outcome] = state["totals"].get(outcome, 0) + 1
+        added += 1
+    if rows_file:
+        rows_file.close()
+
+    if added:
+        # The last page of the previous render gains a "next" link
+        if pages_before and state["pages"] > pages_before:
+            touched.add(pages_before)
+        for number in sorted(touched):
+            _write_page(out_dir, number, state["pages"])
+        _write_index(out_dir, state)
+        (out_dir / _STATE).write_text(json.dumps(state))
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render streamed test results")
+    parser.add_argument("stream_dir", nargs="?", default="reports/stream")
+    parser.add_argument("out_dir", nargs="?", default="reports/html")
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+    added = render(args.stream_dir, args.out_dir, args.page_size)
+    print(f"Rendered {added} new results into {args.out_dir}/index.html")
+
+
+if __name__ == "__main__":
+    main()
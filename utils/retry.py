@@ -0,0 +1,168 @@
+import random
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from functools import wraps
+from typing import Callable, Dict, Iterable, Optional, Tuple, Type
+
+from selenium.common.exceptions import (
+    ElementClickInterceptedException,
+    StaleElementReferenceException,
+    TimeoutException,
+)
+from urllib3.exceptions import MaxRetryError, NewConnectionError, ProtocolError
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+
+class RetryAction(Enum):
+    IMMEDIATE = "immediate"  # retry at once, the next attempt is likely to pass
+    BACKOFF = "backoff"  # retry after an exponential delay with jitter
+    FAIL = "fail"  # re-raise without retrying
+
+
+# First matching entry wins, so specific classes go before their parents
+DEFAULT_RULES: Tuple[Tuple[Tuple[Type[BaseException], ...], RetryAction], ...] = (
+    ((TimeoutException,), RetryAction.FAIL),
+    (
+        (StaleElementReferenceException, ElementClickInterceptedException),
+        RetryAction.IMMEDIATE,
+    ),
+    (
+        (
+            ConnectionError,
+            TimeoutError,
+            ProtocolError,
+            MaxRetryError,
+            NewConnectionError,
+        ),
+        RetryAction.BACKOFF,
+    ),
+)
+
+# Deadline of the running test, set through time_budget by conftest
+_test_deadline: ContextVar[Optional[float]] = ContextVar(
+    "_test_deadline", default=None
+)
+
+
+@contextmanager
+def time_budget(seconds: Optional[float]):
+    """Cap the time all retries of the enclosed block may spend."""
+    token = _test_deadline.set(time.monotonic() + seconds if seconds else None)
+    try:
+        yield
+    finally:
+        _test_deadline.reset(token)
+
+
+class RetryMetrics:
+    """Counts retries per function and action, reported at the end of the run."""
+
+    def __init__(self):
+        self._counts: Counter = Counter()
+
+    def record(self, name: str, action: RetryAction) -> None:
+        self._counts[f"{name}:{action.value}"] += 1
+
+    def snapshot(self) -> Dict[str, int]:
+        return dict(self._counts)
+
+    def since(self, snapshot: Dict[str, int]) -> Dict[str, int]:
+        return {
+            key: count - snapshot.get(key, 0)
+            for key, count in self._counts.items()
+            if count != snapshot.get(key, 0)
+        }
+
+    def reset(self) -> None:
+        self._counts.clear()
+
+
+metrics = RetryMetrics()
+
+
+class RetryPolicy:
+    """
+    Retries a call based on the kind of exception it raised.
+
+    :param retries (int): Retries allowed after the first attempt.
+    :param budget (Optional[float]): Seconds a single call may spend retrying.
+    :param base_delay (float): First backoff delay in seconds.
+    :param max_delay (float): Upper bound of a single backoff delay.
+    :param rules (Iterable): (exception classes, RetryAction) pairs, first match
+        wins.
+    :param default (RetryAction): Action for exceptions no rule matches.
+    """
+
+    def __init__(
+        self,
+        retries: int = 3,
+        budget: Optional[float] = 30.0,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        rules: Iterable = DEFAULT_RULES,
+        default: RetryAction = RetryAction.FAIL,
+    ):
+        self.retries = retries
+        self.budget = budget
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.rules = tuple(rules)
+        self.default = default
+
+    def classify(self, error: BaseException) -> RetryAction:
+        for exceptions, action in self.rules:
+            if isinstance(error, exceptions):
+                return action
+        return self.default
+
+    def backoff(self, attempt: int) -> float:
+        """Full jitter: a random delay up to the exponential cap."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def _deadline(self, started: float) -> Optional[float]:
+        deadline = _test_deadline.get()
+        if self.budget is not None:
+            call_deadline = started + self.budget
+            deadline = min(deadline or call_deadline, call_deadline)
+        return deadline
+
+    def call(self, func: Callable, *args, **kwargs):
+        deadline = self._deadline(time.monotonic())
+        attempt = 0
+        while True:
+            try:
+                return func(*args, **kwargs)
+            except Exception as e:
+                action = self.classify(e)
+                if action is RetryAction.FAIL or attempt >= self.retries:
+                    raise
+                delay = self.backoff(attempt) if action is RetryAction.BACKOFF else 0
+                if deadline is not None and time.monotonic() + delay > deadline:
+                    log.warning(f"Retry budget exhausted for {func.__name__}: {e}")
+                    raise
+                attempt += 1
+                metrics.record(func.__name__, action)
+                log.warning(
+                    f"Attempt {attempt} of {func.__name__} failed "
+                    f"({type(e).__name__}), retrying in {delay:.2f}s"
+                )
+                if delay:
+                    time.sleep(delay)
+
+    def __call__(self, func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return self.call(func, *args, **kwargs)
+
+        return wrapper
+
+
+# Policy for BasePage actions: element churn is retried at once, waits that
+# already timed out are not retried again
+ACTION_POLICY = RetryPolicy(retries=3)
@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+
+def clear_run(directory: str, rendered_dir: str) -> None:
+    """Remove the JSONL logs and rendered report a previous run left behind."""
+    for log_file in Path(directory).glob("results-*.jsonl"):
+        log_file.unlink()
+    # The renderer state holds offsets into the deleted logs
+    shutil.rmtree(rendered_dir, ignore_errors=True)
+
+
+class StreamingReporter:
+    """
+    Appends one JSON line per finished test to <directory>/results-<worker>.jsonl.
+
+    Each xdist worker writes its own file, so no locking is needed and a
+    crashed run keeps every result written up to the crash. Artifacts such as
+    failure screenshots are stored as paths, never inlined.
+
+    :param directory (str): Directory receiving the JSONL logs.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        worker = os.environ.get("PYTEST_XDIST_WORKER", "main")
+        self.path = self.directory / f"results-{worker}.jsonl"
+        self._file = open(self.path, "a", encoding="UTF-8")
+
+    @staticmethod
+    def _should_record(report) -> bool:
+        if getattr(report, "node", None) is not None:
+            # Forwarded by xdist to the controller, the worker already wrote it
+            return False
+        return report.when == "call" or report.outcome != "passed"
+
+    def pytest_runtest_logreport(self, report):
+        if not self._should_record(report):
+            return
+        properties = dict(report.user_properties)
+        record = {
+            "nodeid": report.nodeid,
+            "outcome": report.outcome,
+            "when": report.when,
+            "duration": round(report.duration, 4),
+            "worker": os.environ.get("PYTEST_XDIST_WORKER", "main"),
+            "finished": time.time(),
+            "artifacts": {
+                key: value
+                for key, value in properties.items()
+                if key in ("screenshot",)
+            },
+            "longrepr": str(report.longrepr) if report.failed else None,
+        }
+        self._file.write(json.dumps(record, default=str) + "\n")
+        # Flushed per test: the OS keeps the data even if the worker crashes
+        self._file.flush()
+
+    def pytest_sessionfinish(self):
+        self._file.close()
@@ -0,0 +1,250 @@
+import hashlib
+import io
+import os
+import tempfile
+from pathlib import Path
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+
+from utils.logger import Logger, LogLevel
+
+log = Logger(log_lvl=LogLevel.INFO).get_instance()
+
+# x, y, width and height in screenshot pixels
+Region = Tuple[int, int, int, int]
+
+_PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+class VisualDiff(NamedTuple):
+    changed_ratio: float
+    changed_tiles: int
+    changed_mask: Optional[np.ndarray]
+    message: str = ""
+
+
+def decode_png(data: bytes) -> np.ndarray:
+    """Decode PNG bytes into an (height, width, 3) uint8 array."""
+    with Image.open(io.BytesIO(data)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+class VisualComparator:
+    """
+    Compares screenshots tile by tile with NumPy.
+
+    Tiles are first compared bytewise through a uint64 view, so unchanged
+    regions cost one vectorised equality pass. Only the tiles that differ in
+    some byte are diffed pixel by pixel, and pixel_tolerance alone decides
+    which of their pixels changed.
+
+    :param tile (int): Tile edge in pixels, a multiple of 8.
+    :param pixel_tolerance (int): Channel difference ignored as noise.
+    :param max_diff_ratio (float): Share of changed pixels still accepted.
+    """
+
+    def __init__(
+        self,
+        tile: int = 32,
+        pixel_tolerance: int = 16,
+        max_diff_ratio: float = 0.001,
+    ):
+        if tile % 8:
+            raise ValueError(f"Tile {tile} must be a multiple of 8")
+        self.tile = tile
+        self.pixel_tolerance = pixel_tolerance
+        self.max_diff_ratio = max_diff_ratio
+
+    def _pad(self, pixels: np.ndarray) -> np.ndarray:
+        pad_h, pad_w = -pixels.shape[0] % self.tile, -pixels.shape[1] % self.tile
+        if pad_h or pad_w:
+            pixels = np.pad(pixels, ((0, pad_h), (0, pad_w), (0, 0)))
+        return np.ascontiguousarray(pixels)
+
+    def _tiles(self, pixels: np.ndarray) -> np.ndarray:
+        """View of a padded image as (rows, cols, tile, tile, 3)."""
+        rows, cols = pixels.shape[0] // self.tile, pixels.shape[1] // self.tile
+        return pixels.reshape(rows, self.tile, cols, self.tile, 3).swapaxes(1, 2)
+
+    def changed_tiles(self, baseline: np.ndarray, actual: np.ndarray) -> np.ndarray:
+        """Boolean (rows, cols) grid of tiles that differ in any byte."""
+        rows, cols = baseline.shape[0] // self.tile, baseline.shape[1] // self.tile
+        # A tile row is tile * 3 bytes, always a whole number of uint64 words
+        words = self.tile * 3 // 8
+        base_words = baseline.reshape(baseline.shape[0], -1).view(np.uint64)
+        actual_words = actual.reshape(actual.shape[0], -1).view(np.uint64)
+        return (
+            (base_words != actual_words)
+            .reshape(rows, self.tile, cols, words)
+            .any(axis=(1, 3))
+        )
+
+    @staticmethod
+    def _mask_slices(masks: Sequence[Region]) -> List[Tuple[slice, slice]]:
+        # Clamped at 0, a negative slice end would count from the far edge
+        return [
+            (
+                slice(max(y, 0), max(y + height, 0)),
+                slice(max(x, 0), max(x + width, 0)),
+            )
+            for x, y, width, height in masks
+        ]
+
+    @staticmethod
+    def _apply_mask(pixels: np.ndarray, slices) -> np.ndarray:
+        pixels = pixels.copy()
+        for rows, cols in slices:
+            pixels[rows, cols] = 0
+        return pixels
+
+    def compare(
+        self,
+        baseline: np.ndarray,
+        actual: np.ndarray,
+        masks: Sequence[Region] = (),
+    ) -> VisualDiff:
+        if baseline.shape != actual.shape:
+            return VisualDiff(
+                1.0,
+                0,
+                None,
+                f"Size changed from {baseline.shape[1]}x{baseline.shape[0]} "
+                f"to {actual.shape[1]}x{actual.shape[0]}",
+            )
+
+        height, width = actual.shape[:2]
+        masked_area = 0
+        if masks:
+            slices = self._mask_slices(masks)
+            # Counted as a union clipped to the image, masks may overlap or overflow
+            union = np.zeros((height, width), dtype=bool)
+            for rows, cols in slices:
+                union[rows, cols] = True
+            masked_area = int(union.sum())
+            baseline = self._apply_mask(baseline, slices)
+            actual = self._apply_mask(actual, slices)
+        baseline, actual = self._pad(baseline), self._pad(actual)
+        candidates = self.changed_tiles(baseline, actual)
+        if not candidates.any():
+            return VisualDiff(0.0, 0, None)
+
+        base_tiles = self._tiles(baseline)[candidates].astype(np.int16)
+        actual_tiles = self._tiles(actual)[candidates].astype(np.int16)
+        delta = np.abs(base_tiles - actual_tiles).max(axis=-1)
+        changed = delta > self.pixel_tolerance
+
+        grid = np.zeros(candidates.shape + (self.tile, self.tile), dtype=bool)
+        grid[candidates] = changed
+        rows, cols = candidates.shape
+        changed_mask = grid.swapaxes(1, 2).reshape(
+            rows * self.tile, cols * self.tile
+        )[:height, :width]
+
+        total = max(height * width - masked_area, 1)
+        return VisualDiff(
+            float(changed.sum()) / total,
+            int(changed.any(axis=(1, 2)).sum()),
+            changed_mask,
+        )
+
+    def highlight(self, actual: np.ndarray, diff: VisualDiff) -> np.ndarray:
+        """Copy of the actual screenshot with changed pixels painted red."""
+        image = actual.copy()
+        if diff.changed_mask is not None:
+            image[diff.changed_mask] = (255, 0, 0)
+        return image
+
+
+class BaselineStore:
+    """
+    Content-addressed baseline screenshots.
+
+    Images are stored once under objects/<sha256[:2]>/<sha256>.png and named
+    checkpoints point at them through refs/<name>, so identical baselines are
+    shared and xdist workers never write the same index file.
+
+    :param root (Optional[Path]): Store directory, resources/baselines by default.
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else _PROJECT_DIR / "resources" / "baselines"
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.png"
+
+    def _ref_path(self, name: str) -> Path:
+        return self.root / "refs" / name
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(data)
+        os.replace(tmp, path)
+
+    def get(self, name: str) -> Optional[bytes]:
+        ref = self._ref_path(name)
+        if not ref.exists():
+            return None
+        return self._object_path(ref.read_text().strip()).read_bytes()
+
+    def put(self, name: str, png: bytes) -> str:
+        digest = hashlib.sha256(png).hexdigest()
+        obj = self._object_path(digest)
+        if not obj.exists():
+            self._write_atomic(obj, png)
+        self._write_atomic(self._ref_path(name), digest.encode())
+        return digest
+
+
+def check_visual(
+    name: str,
+    png: bytes,
+    masks: Sequence[Region] = (),
+    max_diff_ratio: Optional[float] = None,
+    comparator: Optional[VisualComparator] = None,
+    store: Optional[BaselineStore] = None,
+) -> VisualDiff:
+    """
+    Compare a screenshot against the baseline stored under name.
+
+    A missing baseline is recorded and passes. With UPDATE_BASELINES=1 the
+    screenshot replaces the baseline. On mismatch the actual and highlighted
+    images are written to reports/visual and an AssertionError is raised.
+    """
+    comparator = comparator or VisualComparator()
+    store = store or BaselineStore()
+    baseline_png = store.get(name)
+
+    if baseline_png is None or os.environ.get("UPDATE_BASELINES") == "1":
+        store.put(name, png)
+        log.info(f"Visual baseline stored for checkpoint '{name}'")
+        return VisualDiff(0.0, 0, None, "baseline stored")
+
+    actual = decode_png(png)
+    diff = comparator.compare(decode_png(baseline_png), actual, masks)
+    limit = comparator.max_diff_ratio if max_diff_ratio is None else max_diff_ratio
+    if diff.changed_ratio <= limit:
+        return diff
+
+    report_dir = _PROJECT_DIR / "reports" / "visual"
+    report_dir.mkdir(parents=True, exist_ok=True)
+    (report_dir / f"{name}-actual.png").write_bytes(png)
+    if diff.changed_mask is not None:
+        (report_dir / f"{name}-diff.png").write_bytes(
+            encode_png(comparator.highlight(actual, diff))
+        )
+    raise AssertionError(
+        f"Visual checkpoint '{name}' changed {diff.changed_ratio:.4%} "
+        f"of pixels in {diff.changed_tiles} tiles (limit {limit:.4%}) "
+        f"{diff.message}".rstrip()
+    )